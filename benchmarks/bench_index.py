@@ -0,0 +1,83 @@
+"""Benchmark building and querying the search index.
+
+Indexes synthetic documents with a Zipf-like vocabulary and reports build
+time, how the per-document insert time changes as the index grows, the
+index file size and a few query timings.  Run from an environment where
+``unbox`` is installed::
+
+    python benchmarks/bench_index.py [--docs N] [--pages N] [--tokens N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import tempfile
+import time
+from pathlib import Path
+
+from unbox.index import SearchIndex
+from unbox.memory import format_size
+
+_VOCABULARY = 50_000
+_QUERIES = ["w3", "w3 w40", '"w1 w2"', "w2000 w3000", '"w500 w501"']
+
+
+def _make_pages(rng: random.Random, pages: int, tokens: int) -> list[str]:
+    """Return *pages* page texts of *tokens* words each."""
+    weights = [1 / rank for rank in range(1, _VOCABULARY + 1)]
+    words = [f"w{rank}" for rank in range(1, _VOCABULARY + 1)]
+    return [" ".join(rng.choices(words, weights, k=tokens)) for _ in range(pages)]
+
+
+def main() -> None:
+    """Build an index, then print build and query statistics."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--docs", type=int, default=200)
+    parser.add_argument("--pages", type=int, default=50)
+    parser.add_argument("--tokens", type=int, default=400)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    # Generating text is slow, so a pool of documents is reused.
+    pool = [_make_pages(rng, args.pages, args.tokens) for _ in range(10)]
+    text_bytes = sum(len(page) + 1 for page in pool[0]) * args.docs
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        index_path = root / "index.db"
+        # Postings are written in batches, so the time per document is
+        # averaged over the first and last quarter of the run.
+        quarter = max(1, args.docs // 4)
+        start = time.perf_counter()
+        with SearchIndex(index_path) as index:
+            for number in range(args.docs):
+                source = root / f"doc{number}.pdf"
+                source.write_text("dummy")
+                index.add_document(source, pool[number % len(pool)])
+                if number == quarter - 1:
+                    first = (time.perf_counter() - start) / quarter
+                if number == args.docs - quarter - 1:
+                    last_start = time.perf_counter()
+        build = time.perf_counter() - start
+        last = (start + build - last_start) / quarter
+        size = index_path.stat().st_size
+        print(f"docs={args.docs} pages={args.pages} tokens={args.tokens}")
+        print(f"text:  {format_size(text_bytes)}")
+        print(f"index: {format_size(size)} ({size / text_bytes:.2f}x text)")
+        print(f"build: {build:.1f}s")
+        print(
+            f"per document: first quarter {first * 1000:.0f}ms, "
+            f"last quarter {last * 1000:.0f}ms"
+        )
+
+        with SearchIndex(index_path, read_only=True) as index:
+            for query in _QUERIES:
+                query_start = time.perf_counter()
+                hits = index.search(query)
+                took = time.perf_counter() - query_start
+                print(f"{query!r:>16}: {took * 1000:8.1f}ms {len(hits):>6} hits")
+
+
+if __name__ == "__main__":
+    main()
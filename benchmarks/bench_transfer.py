@@ -0,0 +1,70 @@
+"""Benchmark returning extracted text from worker processes.
+
+Compares plain pickled ``str`` returns with ``SharedPages`` descriptors for
+several result sizes.  Run from an environment where ``unbox`` is
+installed::
+
+    python benchmarks/bench_transfer.py [--jobs N] [--tasks N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import resource_tracker
+
+from unbox.jobs import SharedPages
+
+_SIZES_MB = [1, 10, 50]
+_LINE = "lorem ipsum dolor sit amet, consectetur adipiscing elit — äöü\n"
+
+
+def _make_text(size_mb: int) -> str:
+    """Return roughly *size_mb* MiB of text."""
+    return _LINE * (size_mb * 1024 * 1024 // len(_LINE))
+
+
+def _return_pickled(size_mb: int) -> str:
+    """Worker returning the text itself (pickled over the pipe)."""
+    return _make_text(size_mb)
+
+
+def _return_shared(size_mb: int) -> SharedPages:
+    """Worker returning a shared-memory descriptor for the text."""
+    return SharedPages.create([_make_text(size_mb)])
+
+
+def _run(mode: str, size_mb: int, jobs: int, tasks: int) -> float:
+    """Return the seconds taken to run *tasks* jobs and collect all text."""
+    worker = _return_pickled if mode == "pickle" else _return_shared
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        # Warm up the pool so process start-up is not measured.
+        list(executor.map(_return_pickled, [0] * jobs))
+        start = time.perf_counter()
+        for result in executor.map(worker, [size_mb] * tasks):
+            text = result if mode == "pickle" else result.load()[0]
+            assert len(text) > 0
+        return time.perf_counter() - start
+
+
+def main() -> None:
+    """Run the benchmark and print a comparison table."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--jobs", type=int, default=4)
+    parser.add_argument("--tasks", type=int, default=16)
+    args = parser.parse_args()
+
+    resource_tracker.ensure_running()
+    print(f"jobs={args.jobs} tasks={args.tasks}")
+    print(f"{'size':>8} {'pickle':>10} {'shared':>10} {'speedup':>8}")
+    for size_mb in _SIZES_MB:
+        pickled = _run("pickle", size_mb, args.jobs, args.tasks)
+        shared = _run("shared", size_mb, args.jobs, args.tasks)
+        print(
+            f"{size_mb:>6}MB {pickled:>9.3f}s {shared:>9.3f}s {pickled / shared:>7.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
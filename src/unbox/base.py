@@ -6,6 +6,8 @@ import abc
 from pathlib import Path
 from typing import TYPE_CHECKING, ClassVar
 
+from unbox.memory import MemoryGovernor
+
 if TYPE_CHECKING:
     pass
 
@@ -14,6 +16,11 @@ if TYPE_CHECKING:
 # are always ``type[BaseExtractor]`` subclasses.
 _registry: dict[str, type] = {}
 
+# Text-layer triage classifications reported by ``BaseExtractor.classify``.
+TRIAGE_TEXT = "text"
+TRIAGE_SCANNED = "scanned"
+TRIAGE_MIXED = "mixed"
+
 
 class BaseExtractor(abc.ABC):
     """Abstract base class for all format extractors.
@@ -31,6 +38,17 @@ class BaseExtractor(abc.ABC):
     supported_extensions: ClassVar[list[str]]
     """File extensions this extractor handles (e.g. ``[".pdf"]``)."""
 
+    def __init__(self, memory: MemoryGovernor | None = None) -> None:
+        """Create an extractor.
+
+        Parameters
+        ----------
+        memory:
+            Memory governor to respect while extracting; defaults to one
+            without a budget.
+        """
+        self.memory = memory if memory is not None else MemoryGovernor()
+
     def __init_subclass__(cls, **kwargs: object) -> None:
         """Register concrete subclasses by their supported extensions."""
         super().__init_subclass__(**kwargs)
@@ -56,5 +74,59 @@ class BaseExtractor(abc.ABC):
             The extracted plain-text content.
         """
 
+    def extract_pages(self, file_path: Path) -> list[str]:
+        """Extract text content from *file_path* split into pages.
+
+        Paginated formats override this so that page numbers can be
+        recovered (e.g. by the search index); the default treats the whole
+        document as a single page.
+
+        Parameters
+        ----------
+        file_path:
+            Path to the source document.
+
+        Returns
+        -------
+        list[str]
+            One string per page, in order.  Pages without text are kept as
+            empty strings so that list positions map to page numbers.
+        """
+        return [self.extract(file_path)]
+
+    def join_pages(self, pages: list[str]) -> str:
+        """Join page texts from ``extract_pages`` into a single document.
+
+        Parameters
+        ----------
+        pages:
+            Page texts as returned by ``extract_pages``.
+
+        Returns
+        -------
+        str
+            Stripped, non-empty pages separated by blank lines.
+        """
+        return "\n\n".join(page.strip() for page in pages if page.strip())
+
+    def classify(self, file_path: Path) -> str | None:
+        """Cheaply classify the text layer of *file_path* without extracting it.
+
+        Formats that can contain image-only content override this to return
+        one of ``TRIAGE_TEXT``, ``TRIAGE_SCANNED`` or ``TRIAGE_MIXED``.
+
+        Parameters
+        ----------
+        file_path:
+            Path to the source document.
+
+        Returns
+        -------
+        str | None
+            The triage classification, or ``None`` if it does not apply
+            (e.g. the format always carries a text layer).
+        """
+        return None
+
     def __repr__(self) -> str:
         return f"<{type(self).__name__} extensions={self.supported_extensions}>"
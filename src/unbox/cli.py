@@ -3,18 +3,34 @@
 from __future__ import annotations
 
 import argparse
+import gc
+import sqlite3
 import sys
+from collections.abc import Iterator
 from pathlib import Path
 
 from unbox import __version__
+from unbox.base import BaseExtractor
+from unbox.index import SearchIndex
+from unbox.jobs import FileResult, extract_file, run_jobs
+from unbox.memory import MemoryGovernor, format_size, parse_size
 from unbox.registry import get_extractor, list_supported_extensions
 
 
+def _parse_size_arg(text: str) -> int:
+    """Argparse type for size arguments such as ``512M``."""
+    try:
+        return parse_size(text)
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError(str(exc)) from exc
+
+
 def _build_parser() -> argparse.ArgumentParser:
     """Build and return the argument parser."""
     parser = argparse.ArgumentParser(
         prog="unbox",
         description="Extract text content from PDF, PowerPoint, and Word files.",
+        epilog="Run 'unbox search --help' to query an index built with --index.",
     )
     parser.add_argument(
         "files",
@@ -34,6 +50,43 @@ def _build_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Print extracted text to stdout instead of writing files.",
     )
+    parser.add_argument(
+        "--index",
+        type=Path,
+        default=None,
+        metavar="PATH",
+        help="Add extracted text to the search index at PATH (created if missing).",
+    )
+    parser.add_argument(
+        "--skip-scanned",
+        action="store_true",
+        help="Skip documents without a text layer (e.g. scanned PDFs).",
+    )
+    parser.add_argument(
+        "--scanned-list",
+        type=Path,
+        default=None,
+        metavar="FILE",
+        help="Write paths of documents without a text layer to FILE "
+        "instead of extracting them.",
+    )
+    parser.add_argument(
+        "--max-memory",
+        type=_parse_size_arg,
+        default=None,
+        metavar="SIZE",
+        help="Memory budget (e.g. 512M, 2G), split evenly across --jobs "
+        "workers. Extractors release cached data and switch to lower-memory "
+        "parsing to stay within it; peak RSS is reported.",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        metavar="N",
+        help="Extract files in N worker processes (default: 1, in-process).",
+    )
     parser.add_argument(
         "--list-formats",
         action="store_true",
@@ -48,6 +101,57 @@ def _build_parser() -> argparse.ArgumentParser:
     return parser
 
 
+def _build_search_parser() -> argparse.ArgumentParser:
+    """Build and return the argument parser for ``unbox search``."""
+    parser = argparse.ArgumentParser(
+        prog="unbox search",
+        description="Search an index built with 'unbox --index'. "
+        "Every term must match on the same page; quote text to match a phrase.",
+    )
+    parser.add_argument(
+        "query",
+        nargs="+",
+        help="Search terms and quoted phrases.",
+    )
+    parser.add_argument(
+        "--index",
+        type=Path,
+        required=True,
+        metavar="PATH",
+        help="Index file to search.",
+    )
+    return parser
+
+
+def _search(argv: list[str]) -> int:
+    """Run ``unbox search`` and print one line per matching page."""
+    parser = _build_search_parser()
+    args = parser.parse_args(argv)
+
+    if not args.index.is_file():
+        print(f"Index not found: {args.index}", file=sys.stderr)
+        return 1
+
+    # The shell strips the quotes around phrases, so every argument is its
+    # own clause and arguments with several words are matched as phrases.
+    query = " ".join(
+        f'"{arg}"' if len(arg.split()) > 1 and '"' not in arg else arg
+        for arg in args.query
+    )
+    try:
+        with SearchIndex(args.index, read_only=True) as index:
+            hits = index.search(query)
+    except sqlite3.Error as exc:
+        print(f"Cannot read index {args.index}: {exc}", file=sys.stderr)
+        return 1
+
+    for hit in hits:
+        print(f"{hit.path}:{hit.page} ({hit.count})")
+    if not hits:
+        print("No matches.")
+    return 0
+
+
 def _resolve_output_path(input_path: Path, output_dir: Path | None) -> Path:
     """Determine the output ``.txt`` path for a given input file."""
     stem = input_path.stem
@@ -68,6 +172,11 @@ def main(argv: list[str] | None = None) -> int:
     int
         Exit code — 0 on success, 1 on error.
     """
+    if argv is None:
+        argv = sys.argv[1:]
+    if argv and argv[0] == "search":
+        return _search(argv[1:])
+
     parser = _build_parser()
     args = parser.parse_args(argv)
 
@@ -87,7 +196,26 @@ def main(argv: list[str] | None = None) -> int:
     if args.output_dir is not None:
         args.output_dir.mkdir(parents=True, exist_ok=True)
 
+    if args.jobs < 1:
+        parser.error("--jobs must be at least 1")
+
+    budget = args.max_memory
+    if budget is not None:
+        budget //= args.jobs
+    memory = MemoryGovernor(budget)
+    # With --jobs, ``memory`` collects the workers' peaks and the parent's
+    # own RSS is tracked separately.
+    parent_memory = MemoryGovernor(budget) if args.jobs > 1 else memory
+    index: SearchIndex | None = None
+    if args.index is not None:
+        try:
+            index = SearchIndex(args.index)
+        except sqlite3.Error as exc:
+            print(f"Cannot open index {args.index}: {exc}", file=sys.stderr)
+            return 1
     errors: list[str] = []
+    scanned: list[Path] = []
+    tasks: list[tuple[BaseExtractor, Path, Path | None]] = []
 
     for file_path in args.files:
         file_path = Path(file_path).resolve()
@@ -104,27 +232,94 @@ def main(argv: list[str] | None = None) -> int:
 
         # Get the extractor
         try:
-            extractor = get_extractor(extension)
+            extractor = get_extractor(extension, memory=memory)
         except ValueError as exc:
             errors.append(str(exc))
             continue
 
-        # Extract text
-        try:
-            text = extractor.extract(file_path)
-        except Exception as exc:  # noqa: BLE001
-            errors.append(f"Error extracting '{file_path.name}': {exc}")
+        out_path = (
+            None if args.stdout else _resolve_output_path(file_path, args.output_dir)
+        )
+        tasks.append((extractor, file_path, out_path))
+
+    # Triage and extract text
+    keep_pages = index is not None
+    skip_scanned = args.skip_scanned or args.scanned_list is not None
+    results: Iterator[FileResult]
+    if args.jobs > 1:
+        results = run_jobs(
+            tasks, args.jobs, keep_pages=keep_pages, skip_scanned=skip_scanned
+        )
+    else:
+        results = (
+            extract_file(
+                extractor,
+                file_path,
+                output_path=out_path,
+                keep_pages=keep_pages,
+                skip_scanned=skip_scanned,
+            )
+            for extractor, file_path, out_path in tasks
+        )
+
+    for result in results:
+        if result.error is not None:
+            errors.append(result.error)
             continue
+        if result.skipped:
+            scanned.append(result.path)
+            print(
+                f"Skipped: {result.path.name} [{result.triage}]",
+                file=sys.stderr if args.stdout else sys.stdout,
+            )
+            continue
+        if index is not None and result.pages is not None:
+            try:
+                index.add_document(result.path, result.pages)
+            except sqlite3.Error as exc:
+                errors.append(f"Error indexing '{result.path.name}': {exc}")
+
+        label = f" [{result.triage}]" if result.triage is not None else ""
+        if memory.budget is not None:
+            rss = result.rss if args.jobs > 1 else memory.sample()
+            memory.observe(rss)
+            if rss is not None:
+                label += f" (RSS {format_size(rss)})"
 
         # Output
         if args.stdout:
-            print(f"=== {file_path.name} ===")
-            print(text)
+            print(f"=== {result.path.name}{label} ===")
+            print(result.text)
             print()
         else:
-            out_path = _resolve_output_path(file_path, args.output_dir)
-            out_path.write_text(text, encoding="utf-8")
-            print(f"Extracted: {file_path.name} -> {out_path}")
+            print(f"Extracted: {result.path.name} -> {result.output_path}{label}")
+
+        # Drop this document's objects before starting the next one
+        del result
+        if parent_memory.over_budget():
+            gc.collect()
+
+    if index is not None:
+        index.close()
+
+    if memory.budget is not None:
+        print(
+            f"Peak RSS: {format_size(memory.peak_rss)} "
+            f"(budget {format_size(memory.budget)}"
+            f"{' per worker' if args.jobs > 1 else ''})",
+            file=sys.stderr,
+        )
+        if args.jobs > 1:
+            parent_memory.sample()
+            print(f"Parent RSS: {format_size(parent_memory.peak_rss)}", file=sys.stderr)
+        if memory.peak_rss > memory.budget:
+            print("Warning: peak RSS exceeded the memory budget.", file=sys.stderr)
+
+    # Record documents without a text layer
+    if args.scanned_list is not None:
+        args.scanned_list.write_text(
+            "".join(f"{path}\n" for path in scanned), encoding="utf-8"
+        )
 
     # Report errors
     if errors:
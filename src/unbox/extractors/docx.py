@@ -2,11 +2,170 @@
 
 from __future__ import annotations
 
+import xml.etree.ElementTree as ET
+import zipfile
 from pathlib import Path
 
 from docx import Document
 
 from unbox.base import BaseExtractor
+from unbox.memory import estimate_package_memory
+
+_W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+_BODY = f"{_W}body"
+_P = f"{_W}p"
+_R = f"{_W}r"
+_HYPERLINK = f"{_W}hyperlink"
+_T = f"{_W}t"
+_BR = f"{_W}br"
+_TYPE = f"{_W}type"
+_TBL = f"{_W}tbl"
+_TR = f"{_W}tr"
+_TR_PR = f"{_W}trPr"
+_GRID_BEFORE = f"{_W}gridBefore"
+_TC = f"{_W}tc"
+_TC_PR = f"{_W}tcPr"
+_GRID_SPAN = f"{_W}gridSpan"
+_V_MERGE = f"{_W}vMerge"
+_VAL = f"{_W}val"
+
+# Text equivalents of run children, as rendered by python-docx's ``Run.text``.
+_RUN_CONTENT = {
+    f"{_W}cr": "\n",
+    f"{_W}noBreakHyphen": "-",
+    f"{_W}ptab": "\t",
+    f"{_W}tab": "\t",
+}
+
+
+def _run_text(run: ET.Element) -> str:
+    """Return the text of a ``w:r`` element the way python-docx renders it."""
+    parts: list[str] = []
+    for child in run:
+        if child.tag == _T:
+            parts.append(child.text or "")
+        elif child.tag == _BR:
+            # Page and column breaks have no text equivalent.
+            if child.get(_TYPE, "textWrapping") == "textWrapping":
+                parts.append("\n")
+        else:
+            parts.append(_RUN_CONTENT.get(child.tag, ""))
+    return "".join(parts)
+
+
+def _paragraph_text(paragraph: ET.Element) -> str:
+    """Return the text of a ``w:p`` element the way python-docx renders it.
+
+    Only direct runs and runs of direct hyperlinks count; runs nested in
+    tracked insertions, text boxes or other containers are ignored.
+    """
+    parts: list[str] = []
+    for child in paragraph:
+        if child.tag == _R:
+            parts.append(_run_text(child))
+        elif child.tag == _HYPERLINK:
+            parts.extend(_run_text(run) for run in child if run.tag == _R)
+    return "".join(parts)
+
+
+def _cell_layout(cell: ET.Element) -> tuple[int, bool]:
+    """Return the grid span of a ``w:tc`` and whether it continues a vertical merge."""
+    props = cell.find(_TC_PR)
+    if props is None:
+        return 1, False
+    span = props.find(_GRID_SPAN)
+    merge = props.find(_V_MERGE)
+    return (
+        1 if span is None else int(span.get(_VAL, "1")),
+        merge is not None and merge.get(_VAL, "continue") == "continue",
+    )
+
+
+def _extract_streaming(file_path: Path) -> str:
+    """Extract text by streaming ``word/document.xml`` without an object tree.
+
+    Produces the same layout as ``DocxExtractor.extract`` (body paragraphs,
+    then tables) while holding only the current block in memory.  As with
+    python-docx, only paragraphs and tables that are direct children of the
+    body are read, and only direct paragraphs of their cells.  Like
+    python-docx's ``row.cells``, a cell spanning several grid columns is
+    repeated once per column and a vertically merged cell repeats the text
+    of the cell it continues.
+    """
+    paragraphs: list[str] = []
+    tables: list[str] = []
+    rows: list[str] = []
+    cells: list[str] = []
+    cell_paragraphs: list[str] = []
+    # Grid offset of the next cell, and ``offset -> (text, span)`` for the
+    # cells of the current and previous row, to resolve vertical merges.
+    grid_offset = 0
+    row_cells: dict[int, tuple[str, int]] = {}
+    above: dict[int, tuple[str, int]] = {}
+    body: ET.Element | None = None
+    stack: list[str] = []
+    # Stack depth of the body-level table being read, if any.
+    table_level: int | None = None
+
+    with (
+        zipfile.ZipFile(file_path) as package,
+        package.open("word/document.xml") as stream,
+    ):
+        for event, elem in ET.iterparse(stream, events=("start", "end")):
+            if event == "start":
+                if elem.tag == _BODY:
+                    body = elem
+                elif elem.tag == _TBL and stack and stack[-1] == _BODY:
+                    table_level = len(stack)
+                stack.append(elem.tag)
+                continue
+
+            stack.pop()
+            in_body = bool(stack) and stack[-1] == _BODY
+            # Path below the body-level table, e.g. [tr, tc] inside a cell.
+            cell_path = (
+                stack[table_level + 1 :]
+                if table_level is not None and len(stack) > table_level
+                else None
+            )
+
+            if elem.tag == _P and in_body:
+                text = _paragraph_text(elem).strip()
+                if text:
+                    paragraphs.append(text)
+            elif elem.tag == _P and cell_path == [_TR, _TC]:
+                cell_paragraphs.append(_paragraph_text(elem))
+            elif elem.tag == _TR_PR and cell_path == [_TR]:
+                before = elem.find(_GRID_BEFORE)
+                if before is not None:
+                    grid_offset = int(before.get(_VAL, "0"))
+            elif elem.tag == _TC and cell_path == [_TR]:
+                span, continues = _cell_layout(elem)
+                if continues and grid_offset in above:
+                    text, repeat = above[grid_offset]
+                else:
+                    text, repeat = "\n".join(cell_paragraphs).strip(), span
+                cell_paragraphs = []
+                row_cells[grid_offset] = (text, repeat)
+                cells.extend([text] * repeat)
+                grid_offset += span
+            elif elem.tag == _TR and cell_path == []:
+                rows.append(" | ".join(cells))
+                cells = []
+                above, row_cells = row_cells, {}
+                grid_offset = 0
+            elif elem.tag == _TBL and in_body:
+                if rows:
+                    tables.append("\n".join(rows))
+                rows = []
+                above = {}
+                table_level = None
+
+            # Drop finished top-level blocks so memory stays flat.
+            if in_body and body is not None:
+                body.clear()
+
+    return "\n\n".join(paragraphs + tables)
 
 
 class DocxExtractor(BaseExtractor):
@@ -17,6 +176,9 @@ class DocxExtractor(BaseExtractor):
     def extract(self, file_path: Path) -> str:
         """Extract text from paragraphs and tables of a Word document.
 
+        When a memory budget is set and loading the document with
+        python-docx would exceed it, the document XML is streamed instead.
+
         Parameters
         ----------
         file_path:
@@ -27,6 +189,11 @@ class DocxExtractor(BaseExtractor):
         str
             Paragraphs joined by newlines, followed by table content.
         """
+        if self.memory.budget is not None and self.memory.should_stream(
+            estimate_package_memory(file_path, "word/")
+        ):
+            return _extract_streaming(file_path)
+
         doc = Document(str(file_path))
         parts: list[str] = []
 
@@ -3,10 +3,21 @@
 from __future__ import annotations
 
 from pathlib import Path
+from typing import ClassVar
 
 import fitz  # PyMuPDF
 
-from unbox.base import BaseExtractor
+from unbox.base import TRIAGE_MIXED, TRIAGE_SCANNED, TRIAGE_TEXT, BaseExtractor
+
+
+def _sample_indices(page_count: int, sample_size: int) -> list[int]:
+    """Return up to *sample_size* page indices spread evenly across the document."""
+    if page_count <= sample_size:
+        return list(range(page_count))
+    if sample_size == 1:
+        return [0]
+    step = (page_count - 1) / (sample_size - 1)
+    return sorted({round(i * step) for i in range(sample_size)})
 
 
 class PdfExtractor(BaseExtractor):
@@ -14,6 +25,103 @@ class PdfExtractor(BaseExtractor):
 
     supported_extensions = [".pdf"]
 
+    triage_sample_size: ClassVar[int] = 5
+    """Number of pages inspected by ``classify``."""
+
+    memory_check_interval: ClassVar[int] = 16
+    """Pages between RSS checks in ``extract_pages`` when a budget is set."""
+
+    def classify(self, file_path: Path) -> str | None:
+        """Classify a PDF as text, scanned or mixed by sampling page resources.
+
+        Only the font and image resource lists of a few sampled pages are
+        read; no text is decoded.  Pages with fonts count as text pages,
+        pages with images but no fonts as scanned pages, and blank pages
+        are ignored.  If every sampled page is blank, the remaining pages
+        are checked in order until one with fonts or images is found.
+
+        Parameters
+        ----------
+        file_path:
+            Path to the ``.pdf`` file.
+
+        Returns
+        -------
+        str | None
+            ``TRIAGE_TEXT`` if every non-blank page seen has a text layer,
+            ``TRIAGE_SCANNED`` if none does, ``TRIAGE_MIXED`` otherwise, or
+            ``None`` if the document has no fonts or images at all.
+        """
+        text_pages = 0
+        image_pages = 0
+        with fitz.open(file_path) as doc:
+            sampled = _sample_indices(len(doc), self.triage_sample_size)
+            for index in sampled:
+                page = doc.load_page(index)
+                if page.get_fonts():
+                    text_pages += 1
+                elif page.get_images():
+                    image_pages += 1
+
+            # Widen the sample until a non-blank page is found.
+            if text_pages == 0 and image_pages == 0:
+                skip = set(sampled)
+                for index in range(len(doc)):
+                    if index in skip:
+                        continue
+                    page = doc.load_page(index)
+                    if page.get_fonts():
+                        text_pages += 1
+                        break
+                    if page.get_images():
+                        image_pages += 1
+                        break
+
+        if text_pages == 0 and image_pages == 0:
+            return None
+        if text_pages == 0:
+            return TRIAGE_SCANNED
+        if image_pages == 0:
+            return TRIAGE_TEXT
+        return TRIAGE_MIXED
+
+    def extract_pages(self, file_path: Path) -> list[str]:
+        """Extract the text of each page of a PDF document.
+
+        Pages without any font resources cannot carry a text layer, so
+        ``get_text`` is skipped for them.  With a memory budget, RSS is
+        checked every ``memory_check_interval`` pages and the MuPDF resource
+        store (fonts, images, display lists) is emptied when RSS is over
+        budget and has grown since the store was last emptied.
+
+        Parameters
+        ----------
+        file_path:
+            Path to the ``.pdf`` file.
+
+        Returns
+        -------
+        list[str]
+            Stripped text of every page, with empty strings for blank pages.
+        """
+        pages: list[str] = []
+        shrunk_at = 0
+        with fitz.open(file_path) as doc:
+            for page_num, page in enumerate(doc, start=1):
+                if page.get_fonts():
+                    pages.append(page.get_text().strip())
+                else:
+                    pages.append("")
+
+                budget = self.memory.budget
+                if budget is None or page_num % self.memory_check_interval:
+                    continue
+                rss = self.memory.sample()
+                if rss is not None and rss > budget and rss > shrunk_at:
+                    fitz.TOOLS.store_shrink(100)
+                    shrunk_at = rss
+        return pages
+
     def extract(self, file_path: Path) -> str:
         """Extract text from all pages of a PDF document.
 
@@ -27,10 +135,4 @@ class PdfExtractor(BaseExtractor):
         str
             Concatenated text from every page, separated by newlines.
         """
-        pages: list[str] = []
-        with fitz.open(file_path) as doc:
-            for page in doc:
-                text = page.get_text()
-                if text.strip():
-                    pages.append(text.strip())
-        return "\n\n".join(pages)
+        return self.join_pages(self.extract_pages(file_path))
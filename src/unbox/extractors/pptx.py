@@ -2,11 +2,86 @@
 
 from __future__ import annotations
 
+import posixpath
+import xml.etree.ElementTree as ET
+import zipfile
 from pathlib import Path
 
 from pptx import Presentation
 
 from unbox.base import BaseExtractor
+from unbox.memory import estimate_package_memory
+
+_A = "{http://schemas.openxmlformats.org/drawingml/2006/main}"
+_P = "{http://schemas.openxmlformats.org/presentationml/2006/main}"
+_R = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}"
+_REL = "{http://schemas.openxmlformats.org/package/2006/relationships}"
+_T = f"{_A}t"
+_BR = f"{_A}br"
+
+# Tag path of a paragraph in a top-level shape's text frame; these are the
+# paragraphs python-pptx reports via ``slide.shapes[i].text_frame``.
+_SHAPE_PARAGRAPH = [
+    f"{_P}sld",
+    f"{_P}cSld",
+    f"{_P}spTree",
+    f"{_P}sp",
+    f"{_P}txBody",
+    f"{_A}p",
+]
+
+
+def _slide_parts(package: zipfile.ZipFile) -> list[str]:
+    """Return the package member names of all slides in presentation order."""
+    rels = ET.fromstring(package.read("ppt/_rels/presentation.xml.rels"))
+    targets = {
+        rel.get("Id"): rel.get("Target", "") for rel in rels.iter(f"{_REL}Relationship")
+    }
+    presentation = ET.fromstring(package.read("ppt/presentation.xml"))
+    parts: list[str] = []
+    for slide_id in presentation.iter(f"{_P}sldId"):
+        target = targets[slide_id.get(f"{_R}id")]
+        if target.startswith("/"):
+            parts.append(target.lstrip("/"))
+        else:
+            parts.append(posixpath.normpath(posixpath.join("ppt", target)))
+    return parts
+
+
+def _slide_text(stream: zipfile.ZipExtFile) -> str:
+    """Stream one slide part and return its shape paragraphs joined by newlines."""
+    parts: list[str] = []
+    stack: list[str] = []
+    for event, elem in ET.iterparse(stream, events=("start", "end")):
+        if event == "start":
+            stack.append(elem.tag)
+            continue
+        if stack == _SHAPE_PARAGRAPH:
+            text = "".join(
+                "\v" if node.tag == _BR else node.text or ""
+                for node in elem.iter()
+                if node.tag in (_T, _BR)
+            ).strip()
+            if text:
+                parts.append(text)
+        stack.pop()
+        if elem.tag in (f"{_A}p", f"{_P}sp"):
+            elem.clear()
+    return "\n".join(parts)
+
+
+def _extract_pages_streaming(file_path: Path) -> list[str]:
+    """Extract slide texts by streaming slide XML without loading the package.
+
+    Only the slide parts are read, one at a time; media and other parts are
+    never decompressed.
+    """
+    with zipfile.ZipFile(file_path) as package:
+        slides_text: list[str] = []
+        for part in _slide_parts(package):
+            with package.open(part) as stream:
+                slides_text.append(_slide_text(stream))
+    return slides_text
 
 
 class PptxExtractor(BaseExtractor):
@@ -14,8 +89,11 @@ class PptxExtractor(BaseExtractor):
 
     supported_extensions = [".pptx"]
 
-    def extract(self, file_path: Path) -> str:
-        """Extract text from all slides of a PowerPoint presentation.
+    def extract_pages(self, file_path: Path) -> list[str]:
+        """Extract the text of each slide of a PowerPoint presentation.
+
+        When a memory budget is set and loading the presentation with
+        python-pptx would exceed it, the slide XML is streamed instead.
 
         Parameters
         ----------
@@ -24,21 +102,60 @@ class PptxExtractor(BaseExtractor):
 
         Returns
         -------
-        str
-            Slide text separated by blank lines, with a heading per slide.
+        list[str]
+            Paragraph text of every slide, with empty strings for slides
+            without text.
         """
+        if self.memory.budget is not None and self.memory.should_stream(
+            estimate_package_memory(file_path, "ppt/slides/")
+        ):
+            return _extract_pages_streaming(file_path)
+
         prs = Presentation(str(file_path))
         slides_text: list[str] = []
 
-        for slide_num, slide in enumerate(prs.slides, start=1):
-            parts: list[str] = [f"--- Slide {slide_num} ---"]
+        for slide in prs.slides:
+            parts: list[str] = []
             for shape in slide.shapes:
                 if shape.has_text_frame:
                     for paragraph in shape.text_frame.paragraphs:
                         text = paragraph.text.strip()
                         if text:
                             parts.append(text)
-            if len(parts) > 1:  # more than just the header
-                slides_text.append("\n".join(parts))
+            slides_text.append("\n".join(parts))
+
+        return slides_text
+
+    def join_pages(self, pages: list[str]) -> str:
+        """Join slide texts, prefixing each non-empty slide with a heading.
+
+        Parameters
+        ----------
+        pages:
+            Slide texts as returned by ``extract_pages``.
+
+        Returns
+        -------
+        str
+            Slide text separated by blank lines, with a heading per slide.
+        """
+        return "\n\n".join(
+            f"--- Slide {slide_num} ---\n{text}"
+            for slide_num, text in enumerate(pages, start=1)
+            if text
+        )
+
+    def extract(self, file_path: Path) -> str:
+        """Extract text from all slides of a PowerPoint presentation.
 
-        return "\n\n".join(slides_text)
+        Parameters
+        ----------
+        file_path:
+            Path to the ``.pptx`` file.
+
+        Returns
+        -------
+        str
+            Slide text separated by blank lines, with a heading per slide.
+        """
+        return self.join_pages(self.extract_pages(file_path))
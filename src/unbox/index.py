@@ -0,0 +1,449 @@
+"""On-disk inverted index over extracted text, with term and phrase search."""
+
+from __future__ import annotations
+
+import re
+import sqlite3
+from collections import defaultdict
+from collections.abc import Iterator
+from dataclasses import dataclass
+from itertools import accumulate
+from operator import sub
+from pathlib import Path
+from types import TracebackType
+from typing import Any
+
+_TOKEN_RE = re.compile(r"\w+")
+_QUERY_RE = re.compile(r'"([^"]*)"|(\S+)')
+
+# Term frequencies are only used to order query evaluation, so counting
+# stops here to keep very common terms cheap.
+_FREQUENCY_CAP = 10_000
+
+# Approximate cost of a single-posting lookup relative to one row of a
+# term's range scan.
+_LOOKUP_COST = 4
+
+# Postings are buffered across documents and written in primary-key order
+# once this many are pending, so each batch touches every term's part of
+# the B-tree once instead of once per document.
+_BATCH_ROWS = 100_000
+
+# Negative cache_size is in KiB.
+_CACHE_KIB = 64 * 1024
+
+_PageKey = tuple[int, int]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS documents (
+    id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL UNIQUE,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    terms BLOB NOT NULL
+);
+CREATE TABLE IF NOT EXISTS terms (
+    id INTEGER PRIMARY KEY,
+    term TEXT NOT NULL UNIQUE
+);
+CREATE TABLE IF NOT EXISTS postings (
+    term_id INTEGER NOT NULL,
+    doc_id INTEGER NOT NULL,
+    page INTEGER NOT NULL,
+    occurrences INTEGER NOT NULL,
+    positions BLOB NOT NULL,
+    PRIMARY KEY (term_id, doc_id, page)
+) WITHOUT ROWID;
+"""
+
+
+def tokenize(text: str) -> list[str]:
+    """Split *text* into lowercase word tokens.
+
+    Parameters
+    ----------
+    text:
+        Text to tokenize.
+
+    Returns
+    -------
+    list[str]
+        Tokens in order of appearance.
+    """
+    return _TOKEN_RE.findall(text.lower())
+
+
+def _encode_deltas(values: list[int]) -> bytes:
+    """Encode ascending non-negative integers as varint deltas."""
+    deltas = list(map(sub, values, [0, *values]))
+    if not deltas or max(deltas) < 0x80:
+        return bytes(deltas)
+    data = bytearray()
+    for delta in deltas:
+        while delta >= 0x80:
+            data.append(delta & 0x7F | 0x80)
+            delta >>= 7
+        data.append(delta)
+    return bytes(data)
+
+
+def _decode_deltas(data: bytes) -> list[int]:
+    """Decode integers encoded by ``_encode_deltas``."""
+    if data.isascii():
+        # Every delta fits in one byte.
+        return list(accumulate(data))
+    values: list[int] = []
+    value = 0
+    delta = 0
+    shift = 0
+    for byte in data:
+        delta |= (byte & 0x7F) << shift
+        if byte & 0x80:
+            shift += 7
+        else:
+            value += delta
+            values.append(value)
+            delta = 0
+            shift = 0
+    return values
+
+
+def _parse_query(query: str) -> list[list[str]]:
+    """Split *query* into clauses: bare terms and double-quoted phrases."""
+    clauses: list[list[str]] = []
+    for phrase, term in _QUERY_RE.findall(query):
+        tokens = tokenize(phrase if phrase else term)
+        if tokens:
+            clauses.append(tokens)
+    return clauses
+
+
+@dataclass(frozen=True)
+class SearchHit:
+    """A page that matches every clause of a search query."""
+
+    path: Path
+    """Source document containing the match."""
+
+    page: int
+    """1-based page (or slide) number."""
+
+    count: int
+    """Number of clause occurrences on the page."""
+
+
+class SearchIndex:
+    """Inverted index mapping terms to document/page postings.
+
+    The index is stored in a single SQLite file.  Each posting records the
+    token positions of a term on one page, so phrase queries can be
+    answered without re-reading the extracted text.  Positions are stored
+    as variable-length deltas, which takes one byte for most of them.
+    Re-adding a changed document replaces its previous postings, which
+    keeps the index current as files are re-extracted.
+
+    Postings are buffered across documents and written in batches sorted by
+    term, which keeps inserts local as the index grows.  Pending postings
+    are written before every search and when the index is closed.
+
+    Parameters
+    ----------
+    path:
+        Location of the index file; created if it does not exist.
+    read_only:
+        Open an existing index for searching only.  The file is neither
+        created nor modified.
+
+    Raises
+    ------
+    sqlite3.Error
+        If the file cannot be opened or is not an SQLite database.  In
+        read-only mode some errors only surface on the first search.
+    """
+
+    def __init__(self, path: Path, *, read_only: bool = False) -> None:
+        self.path = path
+        if read_only:
+            uri = f"{path.resolve().as_uri()}?mode=ro"
+            self._conn = sqlite3.connect(uri, uri=True)
+        else:
+            self._conn = sqlite3.connect(path)
+            self._conn.execute("PRAGMA journal_mode = WAL")
+            self._conn.execute("PRAGMA synchronous = NORMAL")
+            self._conn.executescript(_SCHEMA)
+        self._conn.execute(f"PRAGMA cache_size = -{_CACHE_KIB}")
+        self._term_ids: dict[str, int] = {}
+        self._pending: list[tuple[int, int, int, int, bytes]] = []
+
+    def __enter__(self) -> SearchIndex:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Write pending postings, commit and close the index file."""
+        self._write_pending()
+        self._conn.commit()
+        self._conn.close()
+
+    def _write_pending(self) -> None:
+        """Insert buffered postings in primary-key order."""
+        if not self._pending:
+            return
+        self._pending.sort()
+        self._conn.executemany(
+            "INSERT INTO postings (term_id, doc_id, page, occurrences, positions) "
+            "VALUES (?, ?, ?, ?, ?)",
+            self._pending,
+        )
+        self._pending.clear()
+
+    def _term_id(self, term: str) -> int:
+        """Return the id of *term*, inserting it if needed."""
+        term_id = self._term_ids.get(term)
+        if term_id is None:
+            self._conn.execute("INSERT OR IGNORE INTO terms (term) VALUES (?)", (term,))
+            (term_id,) = self._conn.execute(
+                "SELECT id FROM terms WHERE term = ?", (term,)
+            ).fetchone()
+            self._term_ids[term] = term_id
+        return term_id
+
+    def is_current(self, source: Path) -> bool:
+        """Return ``True`` if *source* is indexed and unchanged since then.
+
+        Parameters
+        ----------
+        source:
+            Path of the original document.
+
+        Returns
+        -------
+        bool
+            Whether the stored modification time and size match the file.
+        """
+        stat = source.stat()
+        row = self._conn.execute(
+            "SELECT mtime_ns, size FROM documents WHERE path = ?", (str(source),)
+        ).fetchone()
+        return row == (stat.st_mtime_ns, stat.st_size)
+
+    def add_document(self, source: Path, pages: list[str]) -> bool:
+        """Index *pages* of *source*, replacing any earlier entry for it.
+
+        Documents whose modification time and size are unchanged since they
+        were last indexed are skipped.  The postings may be buffered until
+        the next batch is written; see the class description.
+
+        Parameters
+        ----------
+        source:
+            Path of the original document.
+        pages:
+            Page texts as returned by ``BaseExtractor.extract_pages``.
+
+        Returns
+        -------
+        bool
+            ``True`` if the document was (re-)indexed, ``False`` if skipped.
+        """
+        if self.is_current(source):
+            return False
+
+        postings: list[tuple[int, int, int, bytes]] = []
+        for page_num, text in enumerate(pages, start=1):
+            positions: dict[str, list[int]] = defaultdict(list)
+            for position, token in enumerate(tokenize(text)):
+                positions[token].append(position)
+            postings.extend(
+                (self._term_id(term), page_num, len(offsets), _encode_deltas(offsets))
+                for term, offsets in positions.items()
+            )
+        terms = _encode_deltas(sorted({posting[0] for posting in postings}))
+
+        stat = source.stat()
+        row = self._conn.execute(
+            "SELECT id, terms FROM documents WHERE path = ?", (str(source),)
+        ).fetchone()
+        if row is None:
+            doc_id = self._conn.execute(
+                "INSERT INTO documents (path, mtime_ns, size, terms) "
+                "VALUES (?, ?, ?, ?)",
+                (str(source), stat.st_mtime_ns, stat.st_size, terms),
+            ).lastrowid
+        else:
+            # The stored term list locates the old postings through the
+            # primary key, so no separate index on doc_id is needed.
+            doc_id, old_terms = row
+            self._write_pending()
+            self._conn.executemany(
+                "DELETE FROM postings WHERE term_id = ? AND doc_id = ?",
+                ((term_id, doc_id) for term_id in _decode_deltas(old_terms)),
+            )
+            self._conn.execute(
+                "UPDATE documents SET mtime_ns = ?, size = ?, terms = ? WHERE id = ?",
+                (stat.st_mtime_ns, stat.st_size, terms, doc_id),
+            )
+
+        self._pending.extend(
+            (term_id, doc_id, page_num, occurrences, blob)
+            for term_id, page_num, occurrences, blob in postings
+        )
+        if len(self._pending) >= _BATCH_ROWS:
+            self._write_pending()
+            self._conn.commit()
+        return True
+
+    def _frequency(self, term_id: int) -> int:
+        """Return the number of pages containing a term, capped for speed."""
+        (count,) = self._conn.execute(
+            "SELECT COUNT(*) FROM (SELECT 1 FROM postings WHERE term_id = ? LIMIT ?)",
+            (term_id, _FREQUENCY_CAP),
+        ).fetchone()
+        return count
+
+    def _rows(
+        self,
+        term_id: int,
+        column: str,
+        frequency: int,
+        candidates: set[_PageKey] | None,
+    ) -> Iterator[tuple[int, int, Any]]:
+        """Yield ``(doc_id, page, column)`` postings of a term.
+
+        With *candidates*, only those pages are returned, looked up one by
+        one when that is cheaper than scanning all pages containing the term.
+        """
+        if candidates is not None and len(candidates) * _LOOKUP_COST < frequency:
+            for doc_id, page in candidates:
+                row = self._conn.execute(
+                    f"SELECT {column} FROM postings "
+                    "WHERE term_id = ? AND doc_id = ? AND page = ?",
+                    (term_id, doc_id, page),
+                ).fetchone()
+                if row is not None:
+                    yield doc_id, page, row[0]
+            return
+
+        cursor = self._conn.execute(
+            f"SELECT doc_id, page, {column} FROM postings WHERE term_id = ?",
+            (term_id,),
+        )
+        for doc_id, page, value in cursor:
+            if candidates is None or (doc_id, page) in candidates:
+                yield doc_id, page, value
+
+    def _match_clause(
+        self,
+        term_ids: list[int],
+        frequencies: dict[int, int],
+        candidates: set[_PageKey] | None,
+    ) -> dict[_PageKey, int]:
+        """Return ``(doc_id, page) -> occurrences`` for a term or phrase."""
+        if len(term_ids) == 1:
+            # Positions are never loaded for single terms.
+            (term_id,) = term_ids
+            return {
+                (doc_id, page): occurrences
+                for doc_id, page, occurrences in self._rows(
+                    term_id, "occurrences", frequencies[term_id], candidates
+                )
+            }
+
+        # Phrase: track candidate phrase start positions per page, starting
+        # from the rarest term and narrowing with the others.
+        offsets = sorted(range(len(term_ids)), key=lambda i: frequencies[term_ids[i]])
+        first, *rest = offsets
+        starts = self._phrase_starts(term_ids, first, frequencies, candidates)
+        for offset in rest:
+            if not starts:
+                break
+            found = self._phrase_starts(term_ids, offset, frequencies, set(starts))
+            starts = {
+                key: common
+                for key, positions in found.items()
+                if (common := starts[key] & positions)
+            }
+        return {key: len(positions) for key, positions in starts.items()}
+
+    def _phrase_starts(
+        self,
+        term_ids: list[int],
+        offset: int,
+        frequencies: dict[int, int],
+        candidates: set[_PageKey] | None,
+    ) -> dict[_PageKey, set[int]]:
+        """Return the phrase start positions implied by the term at *offset*."""
+        term_id = term_ids[offset]
+        starts: dict[_PageKey, set[int]] = {}
+        for doc_id, page, blob in self._rows(
+            term_id, "positions", frequencies[term_id], candidates
+        ):
+            starts[(doc_id, page)] = {
+                position - offset for position in _decode_deltas(blob)
+            }
+        return starts
+
+    def search(self, query: str) -> list[SearchHit]:
+        """Find pages matching every term and quoted phrase in *query*.
+
+        Clauses are evaluated from the rarest term up, and later clauses
+        only consider pages that matched the earlier ones.
+
+        Parameters
+        ----------
+        query:
+            Whitespace-separated terms; double-quoted text is matched as an
+            exact phrase.
+
+        Returns
+        -------
+        list[SearchHit]
+            Matching pages ordered by document path and page number.
+        """
+        clauses = _parse_query(query)
+        if not clauses:
+            return []
+        self._write_pending()
+
+        term_ids: dict[str, int] = {}
+        for term in {token for tokens in clauses for token in tokens}:
+            row = self._conn.execute(
+                "SELECT id FROM terms WHERE term = ?", (term,)
+            ).fetchone()
+            if row is None:
+                return []
+            term_ids[term] = row[0]
+        frequencies = {
+            term_id: self._frequency(term_id) for term_id in term_ids.values()
+        }
+
+        id_clauses = sorted(
+            ([term_ids[token] for token in tokens] for tokens in clauses),
+            key=lambda ids: min(frequencies[term_id] for term_id in ids),
+        )
+        totals = self._match_clause(id_clauses[0], frequencies, None)
+        for ids in id_clauses[1:]:
+            if not totals:
+                break
+            matches = self._match_clause(ids, frequencies, set(totals))
+            totals = {key: totals[key] + count for key, count in matches.items()}
+        if not totals:
+            return []
+
+        paths: dict[int, str] = {}
+        for doc_id in {doc_id for doc_id, _ in totals}:
+            (paths[doc_id],) = self._conn.execute(
+                "SELECT path FROM documents WHERE id = ?", (doc_id,)
+            ).fetchone()
+        hits = [
+            SearchHit(Path(paths[doc_id]), page, count)
+            for (doc_id, page), count in totals.items()
+        ]
+        return sorted(hits, key=lambda hit: (str(hit.path), hit.page))
@@ -0,0 +1,338 @@
+"""Per-file extraction jobs, run in-process or in a pool of worker processes."""
+
+from __future__ import annotations
+
+import gc
+import sys
+from collections import deque
+from collections.abc import Iterator
+from concurrent.futures import Future, ProcessPoolExecutor, wait
+from dataclasses import dataclass, field
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+from pathlib import Path
+
+from unbox.base import TRIAGE_SCANNED, BaseExtractor
+from unbox.memory import peak_process_rss
+
+# Results shorter than this (in characters) are cheaper to pickle than to place
+# in a shared-memory segment, which costs a few system calls to create and map.
+SHARED_MIN_CHARS = 1024 * 1024
+
+# On Windows a segment is destroyed once its last handle closes, so it cannot
+# outlive the worker's handle; results are always pickled there.
+_USE_SHARED_MEMORY = sys.platform != "win32"
+
+# Tasks submitted per worker ahead of the result being consumed.  Finished
+# results wait in the parent or in shared memory until they are yielded, so
+# this bounds how much a slow file at the head of the queue lets pile up.
+_TASKS_PER_WORKER = 2
+
+
+@dataclass(frozen=True)
+class SharedPages:
+    """Descriptor for page texts stored in a shared-memory segment.
+
+    Only the segment name and the encoded length of each page cross the
+    process boundary; the text itself is written once by the worker and read
+    once by the parent.
+    """
+
+    name: str
+    """Name of the shared-memory segment."""
+
+    lengths: tuple[int, ...]
+    """UTF-8 byte length of each page, in order."""
+
+    @classmethod
+    def create(cls, pages: list[str]) -> SharedPages:
+        """Copy *pages* into a new shared-memory segment.
+
+        The segment outlives this call; the receiver must call ``load``,
+        which also unlinks it.
+
+        Parameters
+        ----------
+        pages:
+            Page texts to share.
+
+        Returns
+        -------
+        SharedPages
+            Descriptor to send to the receiving process.
+        """
+        encoded = [page.encode("utf-8") for page in pages]
+        lengths = tuple(len(data) for data in encoded)
+        shm = SharedMemory(create=True, size=max(sum(lengths), 1))
+        try:
+            offset = 0
+            for data in encoded:
+                shm.buf[offset : offset + len(data)] = data
+                offset += len(data)
+        except BaseException:
+            shm.close()
+            shm.unlink()
+            raise
+        shm.close()
+        return cls(shm.name, lengths)
+
+    def load(self) -> list[str]:
+        """Read the page texts back and release the segment.
+
+        Returns
+        -------
+        list[str]
+            The shared page texts.
+        """
+        shm = SharedMemory(name=self.name)
+        try:
+            pages: list[str] = []
+            offset = 0
+            for length in self.lengths:
+                pages.append(str(shm.buf[offset : offset + length], "utf-8"))
+                offset += length
+        finally:
+            shm.close()
+            shm.unlink()
+        return pages
+
+    def discard(self) -> None:
+        """Release the segment without reading it."""
+        try:
+            shm = SharedMemory(name=self.name)
+        except FileNotFoundError:
+            return
+        shm.close()
+        shm.unlink()
+
+
+@dataclass
+class FileResult:
+    """Outcome of extracting a single file."""
+
+    path: Path
+    """Source document."""
+
+    triage: str | None = None
+    """Text-layer classification from ``BaseExtractor.classify``."""
+
+    skipped: bool = False
+    """``True`` if the document was skipped as scanned."""
+
+    text: str | None = None
+    """Extracted text, unless it was written to ``output_path``."""
+
+    pages: list[str] | None = None
+    """Page texts, if requested."""
+
+    output_path: Path | None = None
+    """File the text was written to, if any."""
+
+    rss: int | None = None
+    """Peak RSS of the worker process up to the end of this file (with a
+    budget only)."""
+
+    error: str | None = None
+    """Error message if extraction failed."""
+
+    shared: dict[str, SharedPages] = field(default_factory=dict)
+    """Large ``text``/``pages`` values moved to shared memory by a worker."""
+
+
+def extract_file(
+    extractor: BaseExtractor,
+    file_path: Path,
+    *,
+    output_path: Path | None = None,
+    keep_pages: bool = False,
+    skip_scanned: bool = False,
+) -> FileResult:
+    """Triage and extract one file, optionally writing the text to disk.
+
+    Parameters
+    ----------
+    extractor:
+        Extractor for the file's format.
+    file_path:
+        Path to the source document.
+    output_path:
+        Where to write the extracted text; if ``None`` the text is returned
+        in ``FileResult.text`` instead.
+    keep_pages:
+        Also return the per-page texts (e.g. for indexing).
+    skip_scanned:
+        Skip documents classified as ``TRIAGE_SCANNED``.
+
+    Returns
+    -------
+    FileResult
+        The outcome; extraction errors are reported in ``error`` rather than
+        raised.
+    """
+    result = FileResult(path=file_path)
+    try:
+        result.triage = extractor.classify(file_path)
+        if result.triage == TRIAGE_SCANNED and skip_scanned:
+            result.skipped = True
+            return result
+        if keep_pages:
+            result.pages = extractor.extract_pages(file_path)
+            text = extractor.join_pages(result.pages)
+        else:
+            text = extractor.extract(file_path)
+        if output_path is not None:
+            output_path.write_text(text, encoding="utf-8")
+            result.output_path = output_path
+        else:
+            result.text = text
+    except Exception as exc:  # noqa: BLE001
+        result.error = f"Error extracting '{file_path.name}': {exc}"
+    return result
+
+
+def _share_result(result: FileResult) -> None:
+    """Move large ``text``/``pages`` of *result* into shared memory."""
+    if not _USE_SHARED_MEMORY:
+        return
+    # If a segment cannot be created (e.g. /dev/shm is full), the value is
+    # left in place and pickled instead.
+    if result.text is not None and len(result.text) >= SHARED_MIN_CHARS:
+        try:
+            result.shared["text"] = SharedPages.create([result.text])
+            result.text = None
+        except OSError:
+            pass
+    if result.pages is not None and sum(map(len, result.pages)) >= SHARED_MIN_CHARS:
+        try:
+            result.shared["pages"] = SharedPages.create(result.pages)
+            result.pages = None
+        except OSError:
+            pass
+
+
+def _receive_result(result: FileResult) -> FileResult:
+    """Restore values a worker placed in shared memory."""
+    if "text" in result.shared:
+        (result.text,) = result.shared.pop("text").load()
+    if "pages" in result.shared:
+        result.pages = result.shared.pop("pages").load()
+    return result
+
+
+def _discard_shared(future: Future[FileResult]) -> None:
+    """Release segments of a finished result that will not be consumed."""
+    if not future.done() or future.cancelled() or future.exception() is not None:
+        return
+    for shared in future.result().shared.values():
+        shared.discard()
+
+
+def _run_job(
+    extractor: BaseExtractor,
+    file_path: Path,
+    output_path: Path | None,
+    keep_pages: bool,
+    skip_scanned: bool,
+) -> FileResult:
+    """Worker entry point: extract, write output, and share large results."""
+    memory = extractor.memory
+    # The governor arrives pickled with the parent's readings.
+    memory.peak_rss = 0
+    result = extract_file(
+        extractor,
+        file_path,
+        output_path=output_path,
+        keep_pages=keep_pages,
+        skip_scanned=skip_scanned,
+    )
+    _share_result(result)
+    if memory.budget is not None:
+        # Include spikes between the extractor's own samples.
+        memory.observe(peak_process_rss())
+        if memory.over_budget():
+            gc.collect()
+        result.rss = memory.peak_rss or None
+    return result
+
+
+def _collect(file_path: Path, future: Future[FileResult]) -> FileResult:
+    """Wait for a submitted job and restore its shared values."""
+    try:
+        return _receive_result(future.result())
+    except Exception as exc:  # noqa: BLE001
+        return FileResult(
+            path=file_path, error=f"Error extracting '{file_path.name}': {exc}"
+        )
+
+
+def run_jobs(
+    tasks: list[tuple[BaseExtractor, Path, Path | None]],
+    jobs: int,
+    *,
+    keep_pages: bool = False,
+    skip_scanned: bool = False,
+) -> Iterator[FileResult]:
+    """Extract files in a pool of *jobs* worker processes.
+
+    Workers write output files themselves, so only a small ``FileResult``
+    travels back over the pipe.  Text or pages the parent needs (for
+    ``--stdout`` or indexing) are returned through shared memory when
+    large, and pickled otherwise.  At most ``_TASKS_PER_WORKER * jobs``
+    tasks are in flight at once; more are submitted as results are
+    consumed.
+
+    Parameters
+    ----------
+    tasks:
+        ``(extractor, file_path, output_path)`` for each file; see
+        ``extract_file`` for the meaning of ``output_path``.
+    jobs:
+        Number of worker processes.
+    keep_pages:
+        Also return the per-page texts.
+    skip_scanned:
+        Skip documents classified as ``TRIAGE_SCANNED``.
+
+    Yields
+    ------
+    FileResult
+        One result per task, in task order.  Failures outside extraction
+        (e.g. a crashed worker) are reported in ``error`` rather than raised.
+    """
+    if _USE_SHARED_MEMORY:
+        # Start the tracker before forking so workers register segments with
+        # it rather than each launching their own, which would report the
+        # segments the parent unlinks as leaked.
+        resource_tracker.ensure_running()
+    limit = _TASKS_PER_WORKER * jobs
+    pending: deque[tuple[Path, Future[FileResult]]] = deque()
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        try:
+            for extractor, file_path, output_path in tasks:
+                future = executor.submit(
+                    _run_job,
+                    extractor,
+                    file_path,
+                    output_path,
+                    keep_pages,
+                    skip_scanned,
+                )
+                pending.append((file_path, future))
+                if len(pending) < limit:
+                    continue
+                # Dropped only after collecting, so the segments of a result
+                # whose wait is interrupted are still released below.
+                yield _collect(*pending[0])
+                pending.popleft()
+            while pending:
+                yield _collect(*pending[0])
+                pending.popleft()
+        finally:
+            # Release segments of results that were never consumed, e.g.
+            # when the caller stops iterating early.
+            futures = [future for _, future in pending]
+            for future in futures:
+                future.cancel()
+            wait(futures)
+            for future in futures:
+                _discard_shared(future)
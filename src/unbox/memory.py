@@ -0,0 +1,183 @@
+"""Memory budget tracking for extraction runs."""
+
+from __future__ import annotations
+
+import os
+import re
+import sys
+import zipfile
+from pathlib import Path
+
+_SIZE_RE = re.compile(r"^\s*(\d+(?:\.\d+)?)\s*([KMGT]?)(?:I?B)?\s*$", re.I)
+_UNITS = {"": 1, "K": 1024, "M": 1024**2, "G": 1024**3, "T": 1024**4}
+_STATM = Path("/proc/self/statm")
+
+# Rough ratio of in-memory lxml object tree size to serialized XML size.
+_XML_TREE_OVERHEAD = 10
+
+
+def parse_size(text: str) -> int:
+    """Parse a human-readable size such as ``"512M"`` or ``"2GiB"`` into bytes.
+
+    Parameters
+    ----------
+    text:
+        A number optionally followed by ``K``, ``M``, ``G`` or ``T``
+        (binary multiples, with an optional ``B``/``iB`` suffix).
+
+    Returns
+    -------
+    int
+        The size in bytes.
+
+    Raises
+    ------
+    ValueError
+        If *text* is not a valid size.
+    """
+    match = _SIZE_RE.match(text)
+    if match is None:
+        msg = f"Invalid size: '{text}'. Expected e.g. 512M or 2G."
+        raise ValueError(msg)
+    number, unit = match.groups()
+    return int(float(number) * _UNITS[unit.upper()])
+
+
+def format_size(size: int) -> str:
+    """Format *size* bytes as MiB for reporting."""
+    return f"{size / 1024**2:.1f} MiB"
+
+
+def peak_process_rss() -> int | None:
+    """Return the highest RSS this process has reached, in bytes.
+
+    Unlike periodic ``current_rss`` readings, this includes short spikes
+    between samples.
+
+    Returns
+    -------
+    int | None
+        The peak RSS from ``getrusage``, or ``None`` where it is unavailable.
+    """
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and kilobytes elsewhere.
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def current_rss() -> int | None:
+    """Return the resident set size of this process in bytes.
+
+    Reads ``/proc/self/statm`` where available and otherwise falls back to
+    the peak RSS reported by ``getrusage``.
+
+    Returns
+    -------
+    int | None
+        The RSS in bytes, or ``None`` if it cannot be determined.
+    """
+    try:
+        resident_pages = int(_STATM.read_text().split()[1])
+        return resident_pages * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError, AttributeError):
+        return peak_process_rss()
+
+
+def estimate_package_memory(file_path: Path, xml_prefix: str) -> int:
+    """Estimate the memory needed to load an Office Open XML package.
+
+    python-docx and python-pptx read every part of the package into memory
+    and build object trees for the XML parts they parse.
+
+    Parameters
+    ----------
+    file_path:
+        Path to the ``.docx``/``.pptx`` (zip) file.
+    xml_prefix:
+        Member-name prefix of the XML parts that are parsed into trees
+        (e.g. ``"word/"``).
+
+    Returns
+    -------
+    int
+        Estimated bytes: all uncompressed parts plus the parsed XML trees.
+    """
+    with zipfile.ZipFile(file_path) as package:
+        members = package.infolist()
+    total = sum(info.file_size for info in members)
+    xml = sum(
+        info.file_size
+        for info in members
+        if info.filename.startswith(xml_prefix) and info.filename.endswith(".xml")
+    )
+    return total + xml * _XML_TREE_OVERHEAD
+
+
+class MemoryGovernor:
+    """Track process RSS against an optional memory budget.
+
+    Extractors consult the governor to decide when to release cached
+    resources and whether to use lower-memory parsing paths.  Without a
+    budget every check is a no-op, so extractors can use it unconditionally.
+
+    Parameters
+    ----------
+    budget:
+        Maximum RSS in bytes, or ``None`` for no limit.
+    """
+
+    def __init__(self, budget: int | None = None) -> None:
+        self.budget = budget
+        self.peak_rss = 0
+
+    def sample(self) -> int | None:
+        """Read the current RSS and update ``peak_rss``.
+
+        Returns
+        -------
+        int | None
+            The current RSS in bytes, or ``None`` if unavailable.
+        """
+        rss = current_rss()
+        self.observe(rss)
+        return rss
+
+    def observe(self, rss: int | None) -> None:
+        """Record an RSS reading, e.g. one reported by a worker process.
+
+        Parameters
+        ----------
+        rss:
+            RSS in bytes, or ``None`` if unavailable.
+        """
+        if rss is not None and rss > self.peak_rss:
+            self.peak_rss = rss
+
+    def over_budget(self) -> bool:
+        """Return ``True`` if a budget is set and the current RSS exceeds it."""
+        if self.budget is None:
+            return False
+        rss = self.sample()
+        return rss is not None and rss > self.budget
+
+    def should_stream(self, estimated: int) -> bool:
+        """Decide whether to use a low-memory parsing path.
+
+        Parameters
+        ----------
+        estimated:
+            Estimated additional memory in bytes needed by the regular path.
+
+        Returns
+        -------
+        bool
+            ``True`` if a budget is set and the current RSS plus *estimated*
+            would exceed it.
+        """
+        if self.budget is None:
+            return False
+        rss = self.sample() or 0
+        return rss + estimated > self.budget
@@ -5,15 +5,20 @@ from __future__ import annotations
 # Ensure all extractor modules are imported so they auto-register.
 import unbox.extractors  # noqa: F401
 from unbox.base import BaseExtractor, _registry
+from unbox.memory import MemoryGovernor
 
 
-def get_extractor(extension: str) -> BaseExtractor:
+def get_extractor(
+    extension: str, memory: MemoryGovernor | None = None
+) -> BaseExtractor:
     """Return an extractor instance for the given file *extension*.
 
     Parameters
     ----------
     extension:
         A file extension including the leading dot (e.g. ``".pdf"``).
+    memory:
+        Memory governor passed to the extractor (optional).
 
     Raises
     ------
@@ -28,7 +33,7 @@ def get_extractor(extension: str) -> BaseExtractor:
         supported = ", ".join(sorted(_registry.keys()))
         msg = f"Unsupported file format: '{extension}'. Supported formats: {supported}"
         raise ValueError(msg)
-    return cls()
+    return cls(memory=memory)
 
 
 def list_supported_extensions() -> list[str]:
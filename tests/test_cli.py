@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
+import sqlite3
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
 
 from unbox.cli import main
+from unbox.jobs import FileResult
 
 
 class TestCliListFormats:
@@ -98,3 +100,264 @@ class TestCliExtraction:
         assert result == 0
         captured = capsys.readouterr()
         assert "Stdout output" in captured.out
+
+
+class TestCliTriage:
+    """Tests for scanned-document triage options."""
+
+    @patch("unbox.cli.get_extractor")
+    def test_classification_in_result(
+        self,
+        mock_get: MagicMock,
+        tmp_path: Path,
+        capsys: pytest.CaptureFixture[str],
+    ) -> None:
+        """Verify the triage classification is reported per file."""
+        input_file = tmp_path / "sample.pdf"
+        input_file.write_text("dummy")
+
+        mock_extractor = mock_get.return_value
+        mock_extractor.classify.return_value = "mixed"
+        mock_extractor.extract.return_value = "Some text"
+
+        result = main([str(input_file), "--output-dir", str(tmp_path)])
+
+        assert result == 0
+        assert "[mixed]" in capsys.readouterr().out
+
+    @patch("unbox.cli.get_extractor")
+    def test_skip_scanned(self, mock_get: MagicMock, tmp_path: Path) -> None:
+        """Verify --skip-scanned does not extract image-only documents."""
+        input_file = tmp_path / "scan.pdf"
+        input_file.write_text("dummy")
+
+        mock_extractor = mock_get.return_value
+        mock_extractor.classify.return_value = "scanned"
+
+        result = main([str(input_file), "--skip-scanned"])
+
+        assert result == 0
+        mock_extractor.extract.assert_not_called()
+        assert not (tmp_path / "scan.txt").exists()
+
+    @patch("unbox.cli.get_extractor")
+    def test_skip_message_kept_out_of_stdout_text(
+        self,
+        mock_get: MagicMock,
+        tmp_path: Path,
+        capsys: pytest.CaptureFixture[str],
+    ) -> None:
+        """Verify the skip notice goes to stderr when text is sent to stdout."""
+        input_file = tmp_path / "scan.pdf"
+        input_file.write_text("dummy")
+
+        mock_extractor = mock_get.return_value
+        mock_extractor.classify.return_value = "scanned"
+
+        result = main([str(input_file), "--skip-scanned", "--stdout"])
+
+        assert result == 0
+        captured = capsys.readouterr()
+        assert "Skipped: scan.pdf" in captured.err
+        assert captured.out == ""
+
+    @patch("unbox.cli.get_extractor")
+    def test_scanned_list(self, mock_get: MagicMock, tmp_path: Path) -> None:
+        """Verify --scanned-list records image-only documents in a file."""
+        scan_file = tmp_path / "scan.pdf"
+        scan_file.write_text("dummy")
+        text_file = tmp_path / "text.pdf"
+        text_file.write_text("dummy")
+        list_file = tmp_path / "scanned.txt"
+
+        mock_extractor = mock_get.return_value
+        mock_extractor.classify.side_effect = ["scanned", "text"]
+        mock_extractor.extract.return_value = "Text"
+
+        result = main(
+            [str(scan_file), str(text_file), "--scanned-list", str(list_file)]
+        )
+
+        assert result == 0
+        assert list_file.read_text(encoding="utf-8") == f"{scan_file.resolve()}\n"
+        assert mock_extractor.extract.call_count == 1
+
+
+class TestCliSearch:
+    """Tests for --index and the search subcommand."""
+
+    @patch("unbox.cli.get_extractor")
+    def test_index_then_search(
+        self,
+        mock_get: MagicMock,
+        tmp_path: Path,
+        capsys: pytest.CaptureFixture[str],
+    ) -> None:
+        """Verify extracted pages are indexed and found by ``unbox search``."""
+        input_file = tmp_path / "sample.pdf"
+        input_file.write_text("dummy")
+        index_file = tmp_path / "index.db"
+
+        mock_extractor = mock_get.return_value
+        mock_extractor.classify.return_value = "text"
+        mock_extractor.extract_pages.return_value = ["first page", "needle here"]
+        mock_extractor.join_pages.return_value = "first page\n\nneedle here"
+
+        result = main([str(input_file), "--index", str(index_file)])
+        assert result == 0
+        assert (tmp_path / "sample.txt").read_text(encoding="utf-8") == (
+            "first page\n\nneedle here"
+        )
+        capsys.readouterr()
+
+        result = main(["search", "--index", str(index_file), "needle"])
+        assert result == 0
+        assert f"{input_file.resolve()}:2" in capsys.readouterr().out
+
+    @patch("unbox.cli.get_extractor")
+    def test_multi_word_argument_is_a_phrase(
+        self,
+        mock_get: MagicMock,
+        tmp_path: Path,
+        capsys: pytest.CaptureFixture[str],
+    ) -> None:
+        """Verify an argument the shell unquoted is still matched as a phrase."""
+        input_file = tmp_path / "sample.pdf"
+        input_file.write_text("dummy")
+        index_file = tmp_path / "index.db"
+
+        mock_extractor = mock_get.return_value
+        mock_extractor.classify.return_value = "text"
+        mock_extractor.extract_pages.return_value = [
+            "net amount 30 invoice",
+            "invoice due net 30",
+        ]
+        mock_extractor.join_pages.return_value = "unused"
+
+        assert main([str(input_file), "--index", str(index_file)]) == 0
+        capsys.readouterr()
+
+        result = main(["search", "--index", str(index_file), "invoice", "net 30"])
+        assert result == 0
+        out = capsys.readouterr().out
+        assert f"{input_file.resolve()}:2" in out
+        assert f"{input_file.resolve()}:1" not in out
+
+    def test_search_missing_index(
+        self, tmp_path: Path, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """Verify searching a nonexistent index reports an error."""
+        result = main(["search", "--index", str(tmp_path / "none.db"), "term"])
+        assert result == 1
+        assert "Index not found" in capsys.readouterr().err
+
+    def test_search_invalid_index(
+        self, tmp_path: Path, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """Verify a file that is not an index is reported and left untouched."""
+        index_file = tmp_path / "notes.txt"
+        index_file.write_text("not a database")
+
+        result = main(["search", "--index", str(index_file), "term"])
+
+        assert result == 1
+        assert "Cannot read index" in capsys.readouterr().err
+        assert index_file.read_text() == "not a database"
+
+    def test_search_does_not_modify_other_databases(
+        self, tmp_path: Path, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """Verify searching an unrelated SQLite file does not add tables to it."""
+        db_file = tmp_path / "other.db"
+        with sqlite3.connect(db_file) as conn:
+            conn.execute("CREATE TABLE notes (body TEXT)")
+        conn.close()
+
+        result = main(["search", "--index", str(db_file), "term"])
+
+        assert result == 1
+        assert "Cannot read index" in capsys.readouterr().err
+        with sqlite3.connect(db_file) as conn:
+            tables = conn.execute("SELECT name FROM sqlite_master").fetchall()
+        conn.close()
+        assert tables == [("notes",)]
+
+    def test_unwritable_index_path(
+        self, tmp_path: Path, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """Verify an index path that cannot be created is reported."""
+        input_file = tmp_path / "sample.pdf"
+        input_file.write_text("dummy")
+
+        result = main(
+            [str(input_file), "--index", str(tmp_path / "missing" / "index.db")]
+        )
+
+        assert result == 1
+        assert "Cannot open index" in capsys.readouterr().err
+
+
+class TestCliMaxMemory:
+    """Tests for the --max-memory option."""
+
+    @patch("unbox.cli.get_extractor")
+    def test_reports_peak_rss(
+        self,
+        mock_get: MagicMock,
+        tmp_path: Path,
+        capsys: pytest.CaptureFixture[str],
+    ) -> None:
+        """Verify the budget is passed to extractors and peak RSS is reported."""
+        input_file = tmp_path / "sample.docx"
+        input_file.write_text("dummy")
+
+        mock_extractor = mock_get.return_value
+        mock_extractor.classify.return_value = None
+        mock_extractor.extract.return_value = "Text"
+
+        result = main([str(input_file), "--max-memory", "64G"])
+
+        assert result == 0
+        assert mock_get.call_args.kwargs["memory"].budget == 64 * 1024**3
+        captured = capsys.readouterr()
+        assert "Peak RSS" in captured.err
+        assert "Peak RSS" not in captured.out
+
+    @patch("unbox.cli.run_jobs")
+    @patch("unbox.cli.get_extractor")
+    def test_worker_peak_excludes_parent(
+        self,
+        mock_get: MagicMock,
+        mock_run_jobs: MagicMock,
+        tmp_path: Path,
+        capsys: pytest.CaptureFixture[str],
+    ) -> None:
+        """Verify the per-worker peak comes from workers, not the parent."""
+        input_file = tmp_path / "sample.docx"
+        input_file.write_text("dummy")
+        mock_run_jobs.return_value = iter(
+            [FileResult(path=input_file.resolve(), text="Text", rss=3 * 1024**2)]
+        )
+
+        result = main(
+            [str(input_file), "--stdout", "--jobs", "2", "--max-memory", "64G"]
+        )
+
+        assert result == 0
+        err = capsys.readouterr().err
+        assert "Peak RSS: 3.0 MiB (budget 32768.0 MiB per worker)" in err
+        assert "Parent RSS" in err
+
+    def test_invalid_size_exits(self) -> None:
+        """Verify an unparseable size is rejected by the parser."""
+        with pytest.raises(SystemExit, match="2"):
+            main(["file.pdf", "--max-memory", "huge"])
+
+
+class TestCliJobs:
+    """Tests for the --jobs option."""
+
+    def test_rejects_zero_jobs(self) -> None:
+        """Verify --jobs must be positive."""
+        with pytest.raises(SystemExit, match="2"):
+            main(["file.pdf", "--jobs", "0"])
@@ -2,10 +2,34 @@
 
 from __future__ import annotations
 
+import zipfile
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
-from unbox.extractors.docx import DocxExtractor
+from docx import Document
+from docx.oxml import parse_xml
+
+from unbox.extractors.docx import DocxExtractor, _extract_streaming
+from unbox.memory import MemoryGovernor
+
+_W_NS = 'xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"'
+
+_DOCUMENT_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">
+  <w:body>
+    <w:p><w:pPr><w:tabs><w:tab w:val="left"/></w:tabs></w:pPr>
+      <w:r><w:t>First</w:t><w:tab/><w:t>paragraph</w:t></w:r></w:p>
+    <w:p><w:r><w:t>  </w:t></w:r></w:p>
+    <w:tbl>
+      <w:tr>
+        <w:tc><w:p><w:r><w:t>A</w:t></w:r></w:p></w:tc>
+        <w:tc><w:p><w:r><w:t>B</w:t></w:r></w:p></w:tc>
+      </w:tr>
+    </w:tbl>
+    <w:p><w:r><w:t>Last</w:t></w:r></w:p>
+  </w:body>
+</w:document>
+"""
 
 
 class TestDocxExtractor:
@@ -71,3 +95,58 @@ class TestDocxExtractor:
         result = extractor.extract(Path("test.docx"))
 
         assert result == ""
+
+    @patch("unbox.extractors.docx.Document")
+    def test_extract_streams_when_over_budget(
+        self, mock_doc_cls: MagicMock, tmp_path: Path
+    ) -> None:
+        """Verify the XML is streamed instead of loaded when memory is tight."""
+        docx_file = tmp_path / "test.docx"
+        with zipfile.ZipFile(docx_file, "w") as zf:
+            zf.writestr("word/document.xml", _DOCUMENT_XML)
+
+        extractor = DocxExtractor(memory=MemoryGovernor(budget=1))
+        result = extractor.extract(docx_file)
+
+        mock_doc_cls.assert_not_called()
+        assert result == "First\tparagraph\n\nLast\n\nA | B"
+
+    def test_streaming_matches_python_docx(self, tmp_path: Path) -> None:
+        """Verify streaming output equals python-docx output on a real file."""
+        document = Document()
+        paragraph = document.add_paragraph("Outer ")
+        paragraph._p.append(
+            parse_xml(f"<w:hyperlink {_W_NS}><w:r><w:t>link</w:t></w:r></w:hyperlink>")
+        )
+        paragraph._p.append(
+            parse_xml(
+                f'<w:ins {_W_NS} w:id="1" w:author="a">'
+                "<w:r><w:t>INSERTED</w:t></w:r></w:ins>"
+            )
+        )
+        paragraph._p.append(
+            parse_xml(
+                f"<w:r {_W_NS}><w:pict><w:txbxContent><w:p><w:r>"
+                "<w:t>BOXED</w:t></w:r></w:p></w:txbxContent></w:pict></w:r>"
+            )
+        )
+        paragraph.add_run(" end\tTab").add_break()
+        table = document.add_table(rows=1, cols=2)
+        table.cell(0, 0).text = "A"
+        table.cell(0, 1).text = "B"
+        table.cell(0, 1).add_table(rows=1, cols=1).cell(0, 0).text = "NESTED"
+        merged = document.add_table(rows=3, cols=3)
+        merged.cell(0, 0).merge(merged.cell(0, 1)).text = "WIDE"
+        merged.cell(0, 2).text = "C"
+        merged.cell(1, 2).merge(merged.cell(2, 2)).text = "TALL"
+        merged.cell(1, 0).merge(merged.cell(2, 1)).text = "BLOCK"
+        docx_file = tmp_path / "parity.docx"
+        document.save(str(docx_file))
+
+        expected = DocxExtractor().extract(docx_file)
+
+        assert _extract_streaming(docx_file) == expected
+        assert "BOXED" not in expected
+        assert "INSERTED" not in expected
+        assert "link" in expected
+        assert "WIDE | WIDE | C\nBLOCK | BLOCK | TALL\nBLOCK | BLOCK | TALL" in expected
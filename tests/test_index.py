@@ -0,0 +1,160 @@
+"""Tests for the search index."""
+
+from __future__ import annotations
+
+import sqlite3
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from unbox.index import SearchIndex, _decode_deltas, _encode_deltas, tokenize
+
+
+def _source(tmp_path: Path, name: str) -> Path:
+    """Create an empty source document so it can be stat'ed."""
+    path = tmp_path / name
+    path.write_text("dummy")
+    return path
+
+
+class TestTokenize:
+    """Tests for tokenize."""
+
+    def test_lowercases_and_splits_words(self) -> None:
+        """Verify punctuation is dropped and tokens are lowercased."""
+        assert tokenize("Hello, World! 42") == ["hello", "world", "42"]
+
+
+class TestDeltaEncoding:
+    """Tests for the varint delta encoding of positions and term ids."""
+
+    @pytest.mark.parametrize(
+        "values", [[], [0], [0, 1, 5, 127], [3, 200, 70_000, 70_001], [128]]
+    )
+    def test_round_trip(self, values: list[int]) -> None:
+        """Verify decoding returns the encoded values."""
+        assert _decode_deltas(_encode_deltas(values)) == values
+
+    def test_small_gaps_take_one_byte(self) -> None:
+        """Verify gaps below 128 are stored in a single byte each."""
+        assert len(_encode_deltas([10, 20, 147, 300])) == 5
+
+
+class TestSearchIndex:
+    """Tests for SearchIndex."""
+
+    def test_term_search_returns_pages(self, tmp_path: Path) -> None:
+        """Verify a term query reports every page it appears on."""
+        source = _source(tmp_path, "a.pdf")
+        with SearchIndex(tmp_path / "index.db") as index:
+            index.add_document(source, ["alpha beta", "gamma", "beta beta"])
+            hits = index.search("beta")
+
+        assert [(hit.path, hit.page, hit.count) for hit in hits] == [
+            (source, 1, 1),
+            (source, 3, 2),
+        ]
+
+    def test_terms_must_share_a_page(self, tmp_path: Path) -> None:
+        """Verify multiple terms only match pages containing all of them."""
+        source = _source(tmp_path, "a.pdf")
+        with SearchIndex(tmp_path / "index.db") as index:
+            index.add_document(source, ["alpha beta", "alpha", "beta"])
+            hits = index.search("alpha beta")
+
+        assert [hit.page for hit in hits] == [1]
+
+    def test_phrase_search_requires_adjacent_terms(self, tmp_path: Path) -> None:
+        """Verify quoted phrases match only consecutive tokens in order."""
+        source = _source(tmp_path, "a.pdf")
+        with SearchIndex(tmp_path / "index.db") as index:
+            index.add_document(source, ["quick brown fox", "brown quick fox"])
+            hits = index.search('"quick brown"')
+
+        assert [hit.page for hit in hits] == [1]
+
+    def test_reindex_replaces_postings(self, tmp_path: Path) -> None:
+        """Verify re-adding a document drops its previous postings."""
+        source = _source(tmp_path, "a.pdf")
+        with SearchIndex(tmp_path / "index.db") as index:
+            index.add_document(source, ["old text"])
+            source.write_text("changed content")
+            assert index.add_document(source, ["new text"])
+
+            assert index.search("old") == []
+            assert len(index.search("new")) == 1
+
+    def test_unchanged_document_is_skipped(self, tmp_path: Path) -> None:
+        """Verify an unchanged source is not re-indexed."""
+        source = _source(tmp_path, "a.pdf")
+        with SearchIndex(tmp_path / "index.db") as index:
+            assert index.add_document(source, ["first text"])
+            assert index.is_current(source)
+            assert not index.add_document(source, ["second text"])
+
+            assert len(index.search("first")) == 1
+            assert index.search("second") == []
+
+    def test_phrase_with_repeated_and_common_terms(self, tmp_path: Path) -> None:
+        """Verify phrases are matched when terms repeat or are very common."""
+        source = _source(tmp_path, "a.pdf")
+        pages = ["the the end", "the end of the end", "end the"]
+        pages += ["the filler"] * 50
+        with SearchIndex(tmp_path / "index.db") as index:
+            index.add_document(source, pages)
+            hits = index.search('"the end" filler')
+            phrase_hits = index.search('"the end"')
+            repeated = index.search('"the the end"')
+
+        assert hits == []
+        assert [(hit.page, hit.count) for hit in phrase_hits] == [(1, 1), (2, 2)]
+        assert [hit.page for hit in repeated] == [1]
+
+    def test_unknown_term(self, tmp_path: Path) -> None:
+        """Verify a term missing from the index returns no hits."""
+        source = _source(tmp_path, "a.pdf")
+        with SearchIndex(tmp_path / "index.db") as index:
+            index.add_document(source, ["alpha"])
+            assert index.search("alpha zeta") == []
+
+    def test_index_persists(self, tmp_path: Path) -> None:
+        """Verify the index can be reopened from disk."""
+        source = _source(tmp_path, "a.pdf")
+        with SearchIndex(tmp_path / "index.db") as index:
+            index.add_document(source, ["persistent"])
+
+        with SearchIndex(tmp_path / "index.db") as index:
+            assert len(index.search("persistent")) == 1
+
+    def test_empty_query(self, tmp_path: Path) -> None:
+        """Verify a query without any tokens returns no hits."""
+        with SearchIndex(tmp_path / "index.db") as index:
+            assert index.search("  ...  ") == []
+
+    def test_read_only_does_not_create_schema(self, tmp_path: Path) -> None:
+        """Verify a read-only index neither creates nor modifies the file."""
+        with pytest.raises(sqlite3.OperationalError):
+            SearchIndex(tmp_path / "missing.db", read_only=True)
+        assert not (tmp_path / "missing.db").exists()
+
+        source = _source(tmp_path, "a.pdf")
+        with SearchIndex(tmp_path / "index.db") as index:
+            index.add_document(source, ["stored"])
+        with SearchIndex(tmp_path / "index.db", read_only=True) as index:
+            assert len(index.search("stored")) == 1
+            with pytest.raises(sqlite3.OperationalError):
+                index.add_document(_source(tmp_path, "b.pdf"), ["new"])
+
+    @patch("unbox.index._BATCH_ROWS", 3)
+    def test_full_batches_are_committed(self, tmp_path: Path) -> None:
+        """Verify postings buffered across documents are written in batches."""
+        with SearchIndex(tmp_path / "index.db") as index:
+            index.add_document(_source(tmp_path, "a.pdf"), ["one two"])
+            index.add_document(_source(tmp_path, "b.pdf"), ["two three"])
+            with SearchIndex(tmp_path / "index.db", read_only=True) as reader:
+                assert len(reader.search("two")) == 2
+            index.add_document(_source(tmp_path, "c.pdf"), ["two"])
+            with SearchIndex(tmp_path / "index.db", read_only=True) as reader:
+                assert len(reader.search("two")) == 2
+            assert len(index.search("two")) == 3
@@ -0,0 +1,292 @@
+"""Tests for extraction jobs and shared-memory result transfer."""
+
+from __future__ import annotations
+
+import os
+from concurrent.futures import Future
+from pathlib import Path
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from unbox.base import BaseExtractor
+from unbox.jobs import (
+    FileResult,
+    SharedPages,
+    _receive_result,
+    _run_job,
+    _share_result,
+    extract_file,
+    run_jobs,
+)
+from unbox.memory import MemoryGovernor
+
+
+class _EchoExtractor(BaseExtractor):
+    """Picklable extractor that returns the file content split on form feeds."""
+
+    supported_extensions = []
+
+    def extract_pages(self, file_path: Path) -> list[str]:
+        """Return the form-feed separated pages of *file_path*."""
+        return file_path.read_text(encoding="utf-8").split("\f")
+
+    def extract(self, file_path: Path) -> str:
+        """Return the joined pages of *file_path*."""
+        return self.join_pages(self.extract_pages(file_path))
+
+
+class _FailingGovernor(MemoryGovernor):
+    """Governor whose RSS sampling fails, outside ``extract_file``."""
+
+    def sample(self) -> int | None:
+        """Raise as if RSS could not be read."""
+        raise RuntimeError("rss unavailable")
+
+
+class _SamplingExtractor(_EchoExtractor):
+    """Extractor that samples RSS while extracting, like ``PdfExtractor``."""
+
+    def extract_pages(self, file_path: Path) -> list[str]:
+        """Sample RSS, then return the pages of *file_path*."""
+        self.memory.sample()
+        return super().extract_pages(file_path)
+
+
+class _CrashingExtractor(_EchoExtractor):
+    """Extractor that kills its worker process."""
+
+    def classify(self, file_path: Path) -> str | None:
+        """Exit the process abruptly, as a native crash would."""
+        os._exit(1)
+
+
+class _InlineExecutor:
+    """In-process stand-in for ``ProcessPoolExecutor`` that counts submissions."""
+
+    def __init__(self) -> None:
+        self.submitted = 0
+
+    def __enter__(self) -> _InlineExecutor:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        pass
+
+    def submit(self, fn: Any, *args: Any) -> Future[FileResult]:
+        """Run *fn* immediately and return its completed future."""
+        self.submitted += 1
+        future: Future[FileResult] = Future()
+        future.set_result(fn(*args))
+        return future
+
+
+class TestSharedPages:
+    """Tests for SharedPages."""
+
+    def test_round_trip(self) -> None:
+        """Verify pages, including empty and non-ASCII ones, survive transfer."""
+        pages = ["first", "", "zweite Seite — äöü", "🙂"]
+        assert SharedPages.create(pages).load() == pages
+
+    def test_load_releases_segment(self) -> None:
+        """Verify the segment is unlinked after loading."""
+        shared = SharedPages.create(["text"])
+        shared.load()
+        with pytest.raises(FileNotFoundError):
+            shared.load()
+
+
+class TestShareResult:
+    """Tests for moving results into shared memory and back."""
+
+    @patch("unbox.jobs.SHARED_MIN_CHARS", 10)
+    def test_large_values_are_shared(self) -> None:
+        """Verify text and pages above the threshold travel as descriptors."""
+        result = FileResult(
+            path=Path("a.pdf"), text="long enough text", pages=["long", "pages!"]
+        )
+        _share_result(result)
+
+        assert result.text is None
+        assert result.pages is None
+        assert set(result.shared) == {"text", "pages"}
+
+        _receive_result(result)
+        assert result.text == "long enough text"
+        assert result.pages == ["long", "pages!"]
+        assert result.shared == {}
+
+    @patch("unbox.jobs.SHARED_MIN_CHARS", 1)
+    @patch("unbox.jobs.SharedPages.create", side_effect=OSError("no space"))
+    def test_falls_back_to_pickling(self, _mock_create: MagicMock) -> None:
+        """Verify values stay inline when a segment cannot be created."""
+        result = FileResult(path=Path("a.pdf"), text="text", pages=["text"])
+        _share_result(result)
+
+        assert result.text == "text"
+        assert result.pages == ["text"]
+        assert result.shared == {}
+
+    def test_small_values_stay_inline(self) -> None:
+        """Verify small results are left to be pickled."""
+        result = FileResult(path=Path("a.pdf"), text="short")
+        _share_result(result)
+        assert result.text == "short"
+        assert result.shared == {}
+
+
+class TestExtractFile:
+    """Tests for extract_file."""
+
+    def test_writes_output(self, tmp_path: Path) -> None:
+        """Verify text is written to the output path instead of returned."""
+        source = tmp_path / "a.txt"
+        source.write_text("one\ftwo", encoding="utf-8")
+        out = tmp_path / "out.txt"
+
+        result = extract_file(_EchoExtractor(), source, output_path=out)
+
+        assert result.text is None
+        assert result.output_path == out
+        assert out.read_text(encoding="utf-8") == "one\n\ntwo"
+
+    def test_reports_errors(self) -> None:
+        """Verify extraction errors are captured in the result."""
+        extractor = MagicMock()
+        extractor.classify.side_effect = RuntimeError("boom")
+
+        result = extract_file(extractor, Path("bad.pdf"))
+
+        assert result.error == "Error extracting 'bad.pdf': boom"
+
+    def test_skip_scanned(self) -> None:
+        """Verify scanned documents are skipped without extraction."""
+        extractor = MagicMock()
+        extractor.classify.return_value = "scanned"
+
+        result = extract_file(extractor, Path("scan.pdf"), skip_scanned=True)
+
+        assert result.skipped
+        extractor.extract.assert_not_called()
+
+
+class TestRunJob:
+    """Tests for the worker entry point."""
+
+    @patch("unbox.jobs.peak_process_rss", return_value=None)
+    @patch("unbox.memory.current_rss", side_effect=[500, 100, 100])
+    def test_reports_peak_during_extraction(
+        self, _mock_rss: MagicMock, _mock_peak: MagicMock, tmp_path: Path
+    ) -> None:
+        """Verify the worker reports its peak, not the RSS after extraction."""
+        source = tmp_path / "a.txt"
+        source.write_text("text", encoding="utf-8")
+        memory = MemoryGovernor(budget=10**12)
+        memory.peak_rss = 10**9  # reading taken in the parent
+
+        result = _run_job(_SamplingExtractor(memory=memory), source, None, True, False)
+
+        assert result.rss == 500
+
+    @patch("unbox.jobs.peak_process_rss", return_value=800)
+    @patch("unbox.memory.current_rss", return_value=100)
+    def test_includes_spikes_between_samples(
+        self, _mock_rss: MagicMock, _mock_peak: MagicMock, tmp_path: Path
+    ) -> None:
+        """Verify the process peak from getrusage is included."""
+        source = tmp_path / "a.txt"
+        source.write_text("text", encoding="utf-8")
+        extractor = _SamplingExtractor(memory=MemoryGovernor(budget=10**12))
+
+        result = _run_job(extractor, source, None, True, False)
+
+        assert result.rss == 800
+
+
+class TestRunJobs:
+    """Tests for run_jobs."""
+
+    def test_results_in_order_via_workers(self, tmp_path: Path) -> None:
+        """Verify worker results, including shared-memory ones, arrive in order."""
+        large = "x" * (1024 * 1024 + 1)
+        sources = []
+        for name, content in [("a.txt", "small\fpage"), ("b.txt", large)]:
+            source = tmp_path / name
+            source.write_text(content, encoding="utf-8")
+            sources.append(source)
+        out = tmp_path / "a.out"
+        tasks = [
+            (_EchoExtractor(), sources[0], out),
+            (_EchoExtractor(), sources[1], None),
+        ]
+
+        results = list(run_jobs(tasks, 2, keep_pages=True))
+
+        assert [result.path for result in results] == sources
+        assert results[0].pages == ["small", "page"]
+        assert out.read_text(encoding="utf-8") == "small\n\npage"
+        assert results[1].text == large
+        assert results[1].pages == [large]
+
+    def test_bounds_tasks_in_flight(self, tmp_path: Path) -> None:
+        """Verify only a few tasks per worker are submitted ahead of the caller."""
+        tasks = []
+        for number in range(10):
+            source = tmp_path / f"{number}.txt"
+            source.write_text("text", encoding="utf-8")
+            tasks.append((_EchoExtractor(), source, None))
+        executor = _InlineExecutor()
+
+        with patch("unbox.jobs.ProcessPoolExecutor", return_value=executor):
+            for consumed, result in enumerate(run_jobs(tasks, 2)):
+                assert result.text == "text"
+                assert executor.submitted - consumed <= 4
+
+        assert executor.submitted == 10
+
+    def test_worker_error_outside_extraction(self, tmp_path: Path) -> None:
+        """Verify a worker failure after extraction becomes an error result."""
+        source = tmp_path / "a.txt"
+        source.write_text("text", encoding="utf-8")
+        extractor = _EchoExtractor(memory=_FailingGovernor(budget=1))
+
+        (result,) = run_jobs([(extractor, source, None)], 1)
+
+        assert result.path == source
+        assert result.error == "Error extracting 'a.txt': rss unavailable"
+
+    def test_crashed_worker(self, tmp_path: Path) -> None:
+        """Verify a dead worker pool yields error results instead of raising."""
+        sources = []
+        for name in ("a.txt", "b.txt"):
+            source = tmp_path / name
+            source.write_text("text", encoding="utf-8")
+            sources.append(source)
+        tasks = [(_CrashingExtractor(), source, None) for source in sources]
+
+        results = list(run_jobs(tasks, 1))
+
+        assert [result.path for result in results] == sources
+        assert all(result.error is not None for result in results)
+
+    @pytest.mark.skipif(
+        not Path("/dev/shm").is_dir(), reason="needs POSIX shared memory"
+    )
+    def test_early_stop_releases_segments(self, tmp_path: Path) -> None:
+        """Verify shared segments of unconsumed results are unlinked."""
+        large = "x" * (1024 * 1024 + 1)
+        tasks = []
+        for name in ("a.txt", "b.txt", "c.txt"):
+            source = tmp_path / name
+            source.write_text(large, encoding="utf-8")
+            tasks.append((_EchoExtractor(), source, None))
+        before = set(Path("/dev/shm").iterdir())
+
+        results = run_jobs(tasks, 3)
+        first = next(results)
+        results.close()
+
+        assert first.text == large
+        assert set(Path("/dev/shm").iterdir()) <= before
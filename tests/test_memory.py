@@ -0,0 +1,89 @@
+"""Tests for the memory governor."""
+
+from __future__ import annotations
+
+import zipfile
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from unbox.memory import (
+    MemoryGovernor,
+    current_rss,
+    estimate_package_memory,
+    parse_size,
+    peak_process_rss,
+)
+
+
+class TestParseSize:
+    """Tests for parse_size."""
+
+    @pytest.mark.parametrize(
+        ("text", "expected"),
+        [
+            ("1024", 1024),
+            ("512K", 512 * 1024),
+            ("512M", 512 * 1024**2),
+            ("2G", 2 * 1024**3),
+            ("1.5GiB", int(1.5 * 1024**3)),
+            ("64mb", 64 * 1024**2),
+        ],
+    )
+    def test_parses_units(self, text: str, expected: int) -> None:
+        """Verify binary unit suffixes are applied."""
+        assert parse_size(text) == expected
+
+    def test_rejects_invalid(self) -> None:
+        """Verify ValueError is raised for malformed sizes."""
+        with pytest.raises(ValueError, match="Invalid size"):
+            parse_size("lots")
+
+
+class TestMemoryGovernor:
+    """Tests for MemoryGovernor."""
+
+    def test_current_rss_is_positive(self) -> None:
+        """Verify the process RSS can be read on this platform."""
+        rss = current_rss()
+        assert rss is None or rss > 0
+
+    def test_peak_process_rss_covers_current(self) -> None:
+        """Verify the process peak is at least the current RSS."""
+        peak = peak_process_rss()
+        rss = current_rss()
+        assert peak is None or rss is None or peak >= rss
+
+    def test_no_budget_never_over(self) -> None:
+        """Verify a governor without a budget never asks for action."""
+        memory = MemoryGovernor()
+        assert not memory.over_budget()
+        assert not memory.should_stream(10**15)
+
+    @patch("unbox.memory.current_rss", return_value=200)
+    def test_over_budget_tracks_peak(self, _mock_rss: object) -> None:
+        """Verify RSS above the budget is detected and recorded as peak."""
+        memory = MemoryGovernor(budget=100)
+        assert memory.over_budget()
+        assert memory.peak_rss == 200
+
+    @patch("unbox.memory.current_rss", return_value=60)
+    def test_should_stream_uses_headroom(self, _mock_rss: object) -> None:
+        """Verify streaming is chosen only when the estimate exceeds headroom."""
+        memory = MemoryGovernor(budget=100)
+        assert not memory.should_stream(40)
+        assert memory.should_stream(41)
+
+
+class TestEstimatePackageMemory:
+    """Tests for estimate_package_memory."""
+
+    def test_weights_parsed_xml_parts(self, tmp_path: Path) -> None:
+        """Verify parsed XML parts count more than other package members."""
+        package = tmp_path / "test.docx"
+        with zipfile.ZipFile(package, "w") as zf:
+            zf.writestr("word/document.xml", "x" * 100)
+            zf.writestr("word/media/image1.png", "y" * 1000)
+
+        assert estimate_package_memory(package, "word/") == 1100 + 100 * 10
@@ -5,7 +5,30 @@ from __future__ import annotations
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
-from unbox.extractors.pdf import PdfExtractor
+import fitz
+
+from unbox.base import TRIAGE_MIXED, TRIAGE_SCANNED, TRIAGE_TEXT
+from unbox.extractors.pdf import PdfExtractor, _sample_indices
+from unbox.memory import MemoryGovernor
+
+
+def _mock_page(fonts: list[object], images: list[object]) -> MagicMock:
+    """Build a mock page exposing the given font and image resources."""
+    page = MagicMock()
+    page.get_fonts.return_value = fonts
+    page.get_images.return_value = images
+    return page
+
+
+def _mock_doc(pages: list[MagicMock]) -> MagicMock:
+    """Build a mock document that supports ``len`` and ``load_page``."""
+    mock_doc = MagicMock()
+    mock_doc.__enter__ = MagicMock(return_value=mock_doc)
+    mock_doc.__exit__ = MagicMock(return_value=False)
+    mock_doc.__len__ = MagicMock(return_value=len(pages))
+    mock_doc.__iter__ = MagicMock(return_value=iter(pages))
+    mock_doc.load_page.side_effect = lambda index: pages[index]
+    return mock_doc
 
 
 class TestPdfExtractor:
@@ -54,7 +77,128 @@ class TestPdfExtractor:
 
         assert result == "Content"
 
+    @patch("unbox.extractors.pdf.fitz")
+    def test_extract_skips_pages_without_fonts(self, mock_fitz: MagicMock) -> None:
+        """Verify get_text is not called on pages lacking font resources."""
+        text_page = _mock_page(fonts=[("F1",)], images=[])
+        text_page.get_text.return_value = "Content"
+        image_page = _mock_page(fonts=[], images=[("img",)])
+        mock_fitz.open.return_value = _mock_doc([text_page, image_page])
+
+        extractor = PdfExtractor()
+        result = extractor.extract(Path("test.pdf"))
+
+        assert result == "Content"
+        image_page.get_text.assert_not_called()
+
+    @patch("unbox.extractors.pdf.fitz")
+    def test_extract_pages_keeps_page_numbers(self, mock_fitz: MagicMock) -> None:
+        """Verify blank pages are kept as empty strings in extract_pages."""
+        text_page = _mock_page(fonts=[("F1",)], images=[])
+        text_page.get_text.return_value = " Content \n"
+        image_page = _mock_page(fonts=[], images=[("img",)])
+        mock_fitz.open.return_value = _mock_doc([image_page, text_page])
+
+        extractor = PdfExtractor()
+
+        assert extractor.extract_pages(Path("test.pdf")) == ["", "Content"]
+
+    @patch("unbox.memory.current_rss")
+    @patch("unbox.extractors.pdf.fitz")
+    def test_extract_shrinks_store_over_budget(
+        self, mock_fitz: MagicMock, mock_rss: MagicMock
+    ) -> None:
+        """Verify the store is emptied only when RSS grows past the last shrink."""
+        mock_rss.side_effect = [200, 150, 300]
+        page = _mock_page(fonts=[("F1",)], images=[])
+        page.get_text.return_value = "Content"
+        interval = PdfExtractor.memory_check_interval
+        mock_fitz.open.return_value = _mock_doc([page] * (3 * interval))
+
+        extractor = PdfExtractor(memory=MemoryGovernor(budget=100))
+        extractor.extract(Path("test.pdf"))
+
+        assert mock_rss.call_count == 3
+        assert mock_fitz.TOOLS.store_shrink.call_count == 2
+        mock_fitz.TOOLS.store_shrink.assert_called_with(100)
+
     def test_repr(self) -> None:
         """Verify the repr includes the class name."""
         extractor = PdfExtractor()
         assert "PdfExtractor" in repr(extractor)
+
+
+class TestPdfTriage:
+    """Tests for PdfExtractor.classify."""
+
+    @patch("unbox.extractors.pdf.fitz")
+    def test_classify_text(self, mock_fitz: MagicMock) -> None:
+        """Verify a document whose pages all have fonts is classified as text."""
+        pages = [_mock_page(fonts=[("F1",)], images=[]) for _ in range(3)]
+        mock_fitz.open.return_value = _mock_doc(pages)
+
+        assert PdfExtractor().classify(Path("test.pdf")) == TRIAGE_TEXT
+
+    @patch("unbox.extractors.pdf.fitz")
+    def test_classify_scanned(self, mock_fitz: MagicMock) -> None:
+        """Verify a document of image-only pages is classified as scanned."""
+        pages = [_mock_page(fonts=[], images=[("img",)]) for _ in range(3)]
+        mock_fitz.open.return_value = _mock_doc(pages)
+
+        assert PdfExtractor().classify(Path("test.pdf")) == TRIAGE_SCANNED
+
+    @patch("unbox.extractors.pdf.fitz")
+    def test_classify_mixed(self, mock_fitz: MagicMock) -> None:
+        """Verify text and image-only pages together are classified as mixed."""
+        pages = [
+            _mock_page(fonts=[("F1",)], images=[]),
+            _mock_page(fonts=[], images=[("img",)]),
+        ]
+        mock_fitz.open.return_value = _mock_doc(pages)
+
+        assert PdfExtractor().classify(Path("test.pdf")) == TRIAGE_MIXED
+
+    @patch("unbox.extractors.pdf.fitz")
+    def test_classify_samples_pages(self, mock_fitz: MagicMock) -> None:
+        """Verify only a bounded sample of pages is inspected."""
+        pages = [_mock_page(fonts=[("F1",)], images=[]) for _ in range(100)]
+        mock_doc = _mock_doc(pages)
+        mock_fitz.open.return_value = mock_doc
+
+        PdfExtractor().classify(Path("test.pdf"))
+
+        assert mock_doc.load_page.call_count == PdfExtractor.triage_sample_size
+
+    @patch("unbox.extractors.pdf.fitz")
+    def test_classify_blank_sample_widens(self, mock_fitz: MagicMock) -> None:
+        """Verify sparse text outside the sample is found, not called scanned."""
+        pages = [_mock_page(fonts=[], images=[]) for _ in range(10)]
+        pages[1] = _mock_page(fonts=[("F1",)], images=[])
+        mock_fitz.open.return_value = _mock_doc(pages)
+
+        assert PdfExtractor().classify(Path("test.pdf")) == TRIAGE_TEXT
+
+    @patch("unbox.extractors.pdf.fitz")
+    def test_classify_blank_document(self, mock_fitz: MagicMock) -> None:
+        """Verify a document without fonts or images is not called scanned."""
+        mock_fitz.open.return_value = _mock_doc([_mock_page(fonts=[], images=[])])
+
+        assert PdfExtractor().classify(Path("test.pdf")) is None
+
+    def test_classify_real_sparse_text(self, tmp_path: Path) -> None:
+        """Verify a real PDF with text only on page 2 of 10 is classified text."""
+        pdf_file = tmp_path / "sparse.pdf"
+        doc = fitz.open()
+        for index in range(10):
+            page = doc.new_page()
+            if index == 1:
+                page.insert_text((50, 50), "only text")
+        doc.save(pdf_file)
+        doc.close()
+
+        assert PdfExtractor().classify(pdf_file) == TRIAGE_TEXT
+
+    def test_sample_indices_spread(self) -> None:
+        """Verify sampled indices include the first and last pages."""
+        assert _sample_indices(3, 5) == [0, 1, 2]
+        assert _sample_indices(101, 5) == [0, 25, 50, 75, 100]
@@ -2,10 +2,47 @@
 
 from __future__ import annotations
 
+import zipfile
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 from unbox.extractors.pptx import PptxExtractor
+from unbox.memory import MemoryGovernor
+
+_NS = (
+    'xmlns:a="http://schemas.openxmlformats.org/drawingml/2006/main" '
+    'xmlns:p="http://schemas.openxmlformats.org/presentationml/2006/main" '
+    'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships"'
+)
+
+
+def _write_pptx(path: Path, slides: list[str]) -> None:
+    """Write a minimal presentation whose slides contain *slides* as text."""
+    rels = "".join(
+        f'<Relationship Id="rId{i}" Target="slides/slide{i}.xml"/>'
+        for i in range(1, len(slides) + 1)
+    )
+    # List slides in reverse to check presentation order is honoured.
+    ids = "".join(
+        f'<p:sldId id="{255 + i}" r:id="rId{i}"/>' for i in range(len(slides), 0, -1)
+    )
+    with zipfile.ZipFile(path, "w") as zf:
+        zf.writestr(
+            "ppt/_rels/presentation.xml.rels",
+            '<Relationships xmlns="http://schemas.openxmlformats.org/'
+            f'package/2006/relationships">{rels}</Relationships>',
+        )
+        zf.writestr(
+            "ppt/presentation.xml",
+            f"<p:presentation {_NS}><p:sldIdLst>{ids}</p:sldIdLst></p:presentation>",
+        )
+        for i, text in enumerate(slides, start=1):
+            zf.writestr(
+                f"ppt/slides/slide{i}.xml",
+                f"<p:sld {_NS}><p:cSld><p:spTree><p:sp><p:txBody>"
+                f"<a:p><a:r><a:t>{text}</a:t></a:r></a:p>"
+                "</p:txBody></p:sp></p:spTree></p:cSld></p:sld>",
+            )
 
 
 class TestPptxExtractor:
@@ -53,3 +90,17 @@ class TestPptxExtractor:
 
         # Only the slide header, no content → empty result
         assert result == ""
+
+    @patch("unbox.extractors.pptx.Presentation")
+    def test_extract_streams_when_over_budget(
+        self, mock_prs_cls: MagicMock, tmp_path: Path
+    ) -> None:
+        """Verify slide XML is streamed instead of loaded when memory is tight."""
+        pptx_file = tmp_path / "test.pptx"
+        _write_pptx(pptx_file, ["first", "second"])
+
+        extractor = PptxExtractor(memory=MemoryGovernor(budget=1))
+        result = extractor.extract_pages(pptx_file)
+
+        mock_prs_cls.assert_not_called()
+        assert result == ["second", "first"]